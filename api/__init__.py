@@ -5,7 +5,6 @@ Combines ESPN and TheSportsDB API functions
 
 from .espn import (
     get_galaxy_next_game,
-    get_galaxy_next_game_extended,
     get_dodgers_next_game,
     get_lakers_next_game,
     get_rams_next_game,
@@ -13,16 +12,13 @@ from .espn import (
     get_team_name_from_ref,
 )
 from .sportsdb import (
-    get_galaxy_team_data,
-    get_dodgers_team_data,
-    get_lakers_team_data,
-    get_rams_team_data,
-    get_kings_team_data,
     get_team_logos,
     extract_logos_from_team,
     search_team_logos,
     search_venue_logos,
+    warm_venue_cache,
     test_logo_url,
+    test_logo_urls,
 )
 from .processors import create_game_embed
 from .local_logos import (
@@ -41,23 +37,19 @@ from .team_config import (
 __all__ = [
     # ESPN API functions
     "get_galaxy_next_game",
-    "get_galaxy_next_game_extended",
     "get_dodgers_next_game",
     "get_lakers_next_game",
     "get_rams_next_game",
     "get_kings_next_game",
     "get_team_name_from_ref",
     # TheSportsDB API functions
-    "get_galaxy_team_data",
-    "get_dodgers_team_data",
-    "get_lakers_team_data",
-    "get_rams_team_data",
-    "get_kings_team_data",
     "get_team_logos",
     "extract_logos_from_team",
     "search_team_logos",
     "search_venue_logos",
+    "warm_venue_cache",
     "test_logo_url",
+    "test_logo_urls",
     # Game processing functions
     "create_game_embed",
     # Local logo functions
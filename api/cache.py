@@ -4,11 +4,24 @@ Provides TTL-based caching with statistics and management
 """
 
 import asyncio
+import json
 import logging
+import os
+import sqlite3
 import time
-from typing import Any, Dict, Optional
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from functools import wraps
 
+# Try to import orjson for faster persistent cache (de)serialization (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Cache duration constants (in seconds)
@@ -19,7 +32,24 @@ CACHE_DURATIONS = {
     "venue_data": 86400,  # 1 day (reduced from 6 months for Pi)
     "team_metadata": 7200,  # 2 hours (reduced from 12 hours for Pi)
     "team_names": 86400,  # 1 day (reduced from 6 months for Pi)
+    "team_logos_miss": 3600,  # 1 hour, teams TheSportsDB has no match for
+    "game_data_miss": 300,  # 5 minutes, teams with no upcoming game (off-season)
+    "logo_checks": 86400,  # 1 day, logo URLs confirmed reachable
+}
+
+# Persistent (SQLite) durations for data that rarely changes, so it survives
+# bot restarts. Other cache types stay in memory only.
+PERSISTENT_CACHE_DURATIONS = {
+    "venue_data": 30 * 86400,  # 30 days
+    "team_logos": 7 * 86400,  # 7 days
+    "team_metadata": 7 * 86400,  # 7 days
+    "team_names": 30 * 86400,  # 30 days, ESPN team display names
 }
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "api/data/cache.db")
+
+# Key prefixes of the persisted cache types, so in-memory misses for other
+# keys (game data, logo checks) don't query SQLite
+PERSISTENT_KEY_PREFIXES = ("venue_data_", "team_logos_", "team_metadata_", "team_name_")
 
 # Pi-specific cache limits (can be overridden by environment variables)
 DEFAULT_CACHE_SIZE_LIMIT = 100
@@ -38,6 +68,9 @@ _cache_stats = {
 _cache = {}
 _cache_lock = asyncio.Lock()
 
+# In-flight fetches by key, shared by concurrent callers on a cache miss
+_inflight: Dict[str, asyncio.Future] = {}
+
 
 class CacheEntry:
     """Represents a cache entry with TTL and metadata"""
@@ -76,7 +109,12 @@ class CacheEntry:
 
 
 class CacheManager:
-    """Centralized cache manager with TTL support and statistics"""
+    """
+    Centralized cache manager with TTL support and statistics
+
+    Values are held in-process by reference, so hits return the stored
+    object directly with no serialization or decode step.
+    """
 
     def __init__(self, max_entries: int = None, memory_limit_mb: int = None):
         self._cache = {}
@@ -116,7 +154,7 @@ class CacheManager:
         async with self._lock:
             if key not in self._cache:
                 self._stats["misses"] += 1
-                logger.debug(f"Cache miss for key: {key}")
+                logger.debug("Cache miss for key: %s", key)
                 return None
 
             entry = self._cache[key]
@@ -125,14 +163,14 @@ class CacheManager:
             if entry.is_expired():
                 del self._cache[key]
                 self._stats["misses"] += 1
-                logger.info(f"Cache expired and removed for key: {key}")
+                logger.debug("Cache expired and removed for key: %s", key)
                 return None
 
             # Update access statistics
             value = entry.access()
             self._stats["hits"] += 1
-            logger.info(
-                f"Cache hit for key: {key} (access count: {entry.access_count})"
+            logger.debug(
+                "Cache hit for key: %s (access count: %s)", key, entry.access_count
             )
             return value
 
@@ -144,7 +182,26 @@ class CacheManager:
         async with self._lock:
             self._cache[key] = entry
             self._stats["sets"] += 1
-            logger.info(f"Cache set for key: {key} (type: {cache_type}, TTL: {ttl}s)")
+            logger.debug(
+                "Cache set for key: %s (type: %s, TTL: %ss)", key, cache_type, ttl
+            )
+
+    async def set_many(
+        self, items: Dict[str, Any], cache_type: str = "default"
+    ) -> None:
+        """Set multiple values in cache under a single lock acquisition"""
+        ttl = CACHE_DURATIONS.get(cache_type)
+
+        async with self._lock:
+            for key, value in items.items():
+                self._cache[key] = CacheEntry(value, ttl)
+            self._stats["sets"] += len(items)
+            logger.debug(
+                "Cache set for %s keys (type: %s, TTL: %ss)",
+                len(items),
+                cache_type,
+                ttl,
+            )
 
     async def delete(self, key: str) -> bool:
         """Delete a value from cache"""
@@ -154,7 +211,7 @@ class CacheManager:
                 self._stats["deletes"] += 1
                 logger.info(f"Cache deleted for key: {key}")
                 return True
-            logger.debug(f"Cache delete attempted for non-existent key: {key}")
+            logger.debug("Cache delete attempted for non-existent key: %s", key)
             return False
 
     async def clear(self, cache_type: Optional[str] = None) -> int:
@@ -179,7 +236,7 @@ class CacheManager:
                     f"Cleared {len(keys_to_delete)} entries for type: {cache_type}"
                 )
                 if keys_to_delete:
-                    logger.debug(f"Cleared keys: {keys_to_delete}")
+                    logger.debug("Cleared keys: %s", keys_to_delete)
                 return len(keys_to_delete)
 
     async def cleanup_expired(self) -> int:
@@ -195,7 +252,7 @@ class CacheManager:
 
             if expired_keys:
                 logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-                logger.debug(f"Expired keys: {expired_keys}")
+                logger.debug("Expired keys: %s", expired_keys)
             else:
                 logger.debug("No expired cache entries found during cleanup")
 
@@ -240,8 +297,114 @@ class CacheManager:
         logger.info("Cache warming completed")
 
 
-# Global cache manager instance
+class PersistentCache:
+    """SQLite-backed cache layer for data that should survive bot restarts"""
+
+    def __init__(self, db_path: str = CACHE_DB_PATH):
+        self.db_path = Path(db_path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database on first use"""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.db_path)) as conn, conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_entries (
+                        key TEXT PRIMARY KEY,
+                        cache_type TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                """)
+            self._initialized = True
+            logger.info(f"Persistent cache database ready at {self.db_path}")
+        return sqlite3.connect(self.db_path)
+
+    def _get(self, key: str) -> Optional[Tuple[Any, str]]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT value, cache_type, expires_at FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, cache_type, expires_at = row
+            if expires_at <= time.time():
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+
+            value = orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
+            return value, cache_type
+
+    def _set_many(self, items: Dict[str, Any], cache_type: str):
+        expires_at = time.time() + PERSISTENT_CACHE_DURATIONS[cache_type]
+        # default=dict covers read-only MappingProxyType values
+        dumps = orjson.dumps if ORJSON_AVAILABLE else json.dumps
+        rows = [
+            (key, cache_type, dumps(value, default=dict), expires_at)
+            for key, value in items.items()
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _delete(self, key: str):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def _clear(self, cache_type: Optional[str]) -> int:
+        with closing(self._connect()) as conn, conn:
+            if cache_type is None:
+                cursor = conn.execute("DELETE FROM cache_entries")
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM cache_entries WHERE cache_type = ?", (cache_type,)
+                )
+            return cursor.rowcount
+
+    def _cleanup_expired(self) -> int:
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+
+    async def _run(self, func, *args, default=None):
+        """Run a blocking database operation in a worker thread"""
+        try:
+            return await asyncio.to_thread(func, *args)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Persistent cache error in {func.__name__}: {e}")
+            return default
+
+    async def get(self, key: str) -> Optional[Tuple[Any, str]]:
+        """Get a (value, cache_type) pair, or None if missing or expired"""
+        return await self._run(self._get, key)
+
+    async def set_many(self, items: Dict[str, Any], cache_type: str) -> None:
+        """Store values if their cache type is persisted"""
+        if items and cache_type in PERSISTENT_CACHE_DURATIONS:
+            await self._run(self._set_many, items, cache_type)
+
+    async def delete(self, key: str) -> None:
+        """Delete a value"""
+        await self._run(self._delete, key)
+
+    async def clear(self, cache_type: Optional[str] = None) -> int:
+        """Clear all entries, optionally by type"""
+        return await self._run(self._clear, cache_type, default=0)
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired entries"""
+        return await self._run(self._cleanup_expired, default=0)
+
+
+# Global cache manager instances
 cache_manager = CacheManager()
+persistent_cache = PersistentCache()
 
 
 def cache_result(cache_type: str, key_func: Optional[callable] = None):
@@ -287,20 +450,41 @@ def cache_result(cache_type: str, key_func: Optional[callable] = None):
 
 # Convenience functions for common cache operations
 async def get_cached(key: str) -> Optional[Any]:
-    """Get a value from cache"""
-    logger.debug(f"Getting cached value for key: {key}")
-    return await cache_manager.get(key)
+    """Get a value from cache, falling back to the persistent cache"""
+    logger.debug("Getting cached value for key: %s", key)
+    value = await cache_manager.get(key)
+    if value is not None or not key.startswith(PERSISTENT_KEY_PREFIXES):
+        return value
+
+    persisted = await persistent_cache.get(key)
+    if persisted is None:
+        return None
+
+    # Promote to the in-memory cache for subsequent lookups
+    value, cache_type = persisted
+    logger.debug("Persistent cache hit for key: %s", key)
+    await cache_manager.set(key, value, cache_type)
+    return value
 
 
 async def set_cached(key: str, value: Any, cache_type: str = "default") -> None:
-    """Set a value in cache"""
-    logger.debug(f"Setting cached value for key: {key} (type: {cache_type})")
+    """Set a value in cache (and the persistent cache for long-lived types)"""
+    logger.debug("Setting cached value for key: %s (type: %s)", key, cache_type)
     await cache_manager.set(key, value, cache_type)
+    await persistent_cache.set_many({key: value}, cache_type)
+
+
+async def set_cached_many(items: Dict[str, Any], cache_type: str = "default") -> None:
+    """Set multiple values in cache"""
+    logger.debug("Setting %s cached values (type: %s)", len(items), cache_type)
+    await cache_manager.set_many(items, cache_type)
+    await persistent_cache.set_many(items, cache_type)
 
 
 async def delete_cached(key: str) -> bool:
     """Delete a value from cache"""
-    logger.debug(f"Deleting cached value for key: {key}")
+    logger.debug("Deleting cached value for key: %s", key)
+    await persistent_cache.delete(key)
     return await cache_manager.delete(key)
 
 
@@ -310,6 +494,7 @@ async def clear_cache(cache_type: Optional[str] = None) -> int:
         logger.info(f"Clearing cache entries for type: {cache_type}")
     else:
         logger.info("Clearing all cache entries")
+    await persistent_cache.clear(cache_type)
     return await cache_manager.clear(cache_type)
 
 
@@ -322,49 +507,103 @@ async def get_cache_stats() -> Dict[str, Any]:
 async def cleanup_expired_cache() -> int:
     """Clean up expired cache entries"""
     logger.debug("Cleaning up expired cache entries")
+    await persistent_cache.cleanup_expired()
     return await cache_manager.cleanup_expired()
 
 
+async def single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run factory() once per key at a time
+
+    Concurrent callers with the same key await the first caller's fetch
+    instead of starting their own. The fetch keeps running if one of the
+    waiting callers is cancelled.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+
+        def _done(finished_task):
+            if _inflight.get(key) is finished_task:
+                del _inflight[key]
+
+        task.add_done_callback(_done)
+    else:
+        logger.debug("Joining in-flight fetch for key: %s", key)
+
+    return await asyncio.shield(task)
+
+
+async def get_or_set_cached(
+    key: str, factory: Callable[[], Awaitable[Any]], cache_type: str = "default"
+) -> Optional[Any]:
+    """
+    Get a value from cache, fetching and caching it on a miss
+
+    Concurrent misses on the same key share one factory() call. A None
+    result is returned as-is and not cached.
+    """
+    cached_result = await get_cached(key)
+    if cached_result is not None:
+        return cached_result
+
+    async def _fetch_and_set():
+        value = await factory()
+        if value is not None:
+            await set_cached(key, value, cache_type)
+        return value
+
+    return await single_flight(key, _fetch_and_set)
+
+
 # Cache key generators for common patterns
 def game_data_key(team: str, sport: str, start_date: str, end_date: str) -> str:
     """Generate cache key for game data"""
     key = f"game_data_{team}_{sport}_{start_date}_{end_date}"
-    logger.debug(f"Generated game data cache key: {key}")
+    logger.debug("Generated game data cache key: %s", key)
     return key
 
 
 def team_logos_key(team_id: str) -> str:
     """Generate cache key for team logos"""
     key = f"team_logos_{team_id}"
-    logger.debug(f"Generated team logos cache key: {key}")
+    logger.debug("Generated team logos cache key: %s", key)
     return key
 
 
 def team_logos_by_name_key(team_name: str) -> str:
     """Generate cache key for team logos by name"""
     key = f"team_logos_name_{team_name.lower().replace(' ', '_')}"
-    logger.debug(f"Generated team logos by name cache key: {key}")
+    logger.debug("Generated team logos by name cache key: %s", key)
     return key
 
 
 def venue_data_key(venue_name: str) -> str:
     """Generate cache key for venue data"""
     key = f"venue_data_{venue_name.lower().replace(' ', '_')}"
-    logger.debug(f"Generated venue data cache key: {key}")
+    logger.debug("Generated venue data cache key: %s", key)
     return key
 
 
 def team_metadata_key(team_name: str) -> str:
     """Generate cache key for team metadata"""
     key = f"team_metadata_{team_name.lower().replace(' ', '_')}"
-    logger.debug(f"Generated team metadata cache key: {key}")
+    logger.debug("Generated team metadata cache key: %s", key)
     return key
 
 
 def team_name_key(team_ref: str) -> str:
     """Generate cache key for team name"""
     key = f"team_name_{team_ref}"
-    logger.debug(f"Generated team name cache key: {key}")
+    logger.debug("Generated team name cache key: %s", key)
+    return key
+
+
+def logo_check_key(url: str) -> str:
+    """Generate cache key for a logo URL reachability check"""
+    key = f"logo_checks_{url}"
+    logger.debug("Generated logo check cache key: %s", key)
     return key
 
 
@@ -390,18 +629,23 @@ async def cache_cleanup_task():
 # Export main functions
 __all__ = [
     "cache_manager",
+    "persistent_cache",
     "cache_result",
     "get_cached",
     "set_cached",
+    "set_cached_many",
     "delete_cached",
     "clear_cache",
     "get_cache_stats",
     "cleanup_expired_cache",
+    "single_flight",
+    "get_or_set_cached",
     "game_data_key",
     "team_logos_key",
     "team_logos_by_name_key",
     "venue_data_key",
     "team_metadata_key",
     "team_name_key",
+    "logo_check_key",
     "cache_cleanup_task",
 ]
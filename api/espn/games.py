@@ -3,11 +3,18 @@ ESPN Games API module for goobie-bot
 Handles all ESPN API calls related to games and events
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
 from api.http_client import get_json
-from api.cache import game_data_key, get_cached, set_cached
+from api.cache import (
+    delete_cached,
+    game_data_key,
+    get_cached,
+    set_cached,
+    single_flight,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +24,9 @@ TEAM_CONFIG = {
         "sport": "soccer",
         "league": "usa.1",
         "team_id": "187",
-        "days_ahead": 14,
+        # One wide window covers off-season and international breaks in one pass
+        "days_ahead": 90,
+        "limit": 25,
     },
     "dodgers": {
         "sport": "baseball",
@@ -36,6 +45,171 @@ TEAM_CONFIG = {
 }
 
 
+def parse_espn_date(date_str: str) -> datetime:
+    """Parse an ESPN ISO date such as "2025-03-01T03:30Z" into an aware datetime"""
+    # fromisoformat only accepts a "Z" suffix from Python 3.11
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+    return datetime.fromisoformat(date_str)
+
+
+def _game_has_started(game_data: Dict[str, Any]) -> bool:
+    """Check whether a game's scheduled start time has passed"""
+    event_date_str = game_data.get("date")
+    if not event_date_str:
+        return False
+    try:
+        event_date = parse_espn_date(event_date_str)
+    except ValueError:
+        return False
+    return event_date <= datetime.now(event_date.tzinfo)
+
+
+# Top-level ESPN event fields read by embeds and weekly schedules
+_EVENT_FIELDS = ("id", "date", "name")
+
+
+def _pick(data: Dict[str, Any], fields) -> Dict[str, Any]:
+    """Copy only the given fields that are present, so .get() defaults still apply"""
+    return {field: data[field] for field in fields if field in data}
+
+
+def _trim_event(event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the event fields the bot reads
+
+    ESPN event payloads carry kilobytes of odds, links and broadcast data.
+    Dropping it right after parsing keeps cached games and weekly schedules
+    small. Embeds and schedules read the date, name, venue and competitors.
+    """
+    competitions = []
+    for competition in event_data.get("competitions", [])[:1]:
+        trimmed = {
+            "competitors": [
+                {
+                    "id": competitor.get("id"),
+                    "homeAway": competitor.get("homeAway"),
+                    "team": {"$ref": competitor.get("team", {}).get("$ref")},
+                }
+                for competitor in competition.get("competitors", [])
+            ]
+        }
+        if "venue" in competition:
+            trimmed["venue"] = _pick(competition["venue"], ("fullName",))
+        competitions.append(trimmed)
+
+    trimmed_event = _pick(event_data, _EVENT_FIELDS)
+    trimmed_event["competitions"] = competitions
+    return trimmed_event
+
+
+# Max concurrent ESPN event detail requests across all lookups
+ESPN_EVENT_CONCURRENCY = 8
+_event_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_event_semaphore() -> asyncio.Semaphore:
+    """Create the event semaphore lazily so it binds to the running event loop"""
+    global _event_semaphore
+    if _event_semaphore is None:
+        _event_semaphore = asyncio.Semaphore(ESPN_EVENT_CONCURRENCY)
+    return _event_semaphore
+
+
+async def _fetch_event(event_ref: str) -> Optional[Dict[str, Any]]:
+    """Fetch one ESPN event without exceeding the shared concurrency cap"""
+    async with _get_event_semaphore():
+        return await get_json(event_ref)
+
+
+async def _fetch_event_details(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Follow the $ref of each ESPN event list item, fetching them concurrently"""
+    event_refs = [item["$ref"] for item in items if item.get("$ref")]
+    logger.debug("Fetching %d event details", len(event_refs))
+
+    # get_json returns None on failure, so one bad event doesn't sink the rest
+    events = await asyncio.gather(*(_fetch_event(ref) for ref in event_refs))
+    return [_trim_event(event_data) for event_data in events if event_data]
+
+
+async def _fetch_team_next_game(
+    team_name: str,
+    config: Dict[str, Any],
+    start_date: str,
+    end_date: str,
+    cache_key: str,
+) -> Optional[Dict[str, Any]]:
+    """Fetch a team's next game from ESPN and cache it"""
+    logger.info(f"Date range: {start_date} to {end_date}")
+
+    # ESPN API endpoint
+    url = f"http://sports.core.api.espn.com/v2/sports/{config['sport']}/leagues/{config['league']}/teams/{config['team_id']}/events"
+    params = {"dates": f"{start_date}-{end_date}", "limit": config.get("limit", 10)}
+
+    data = await get_json(url, params=params)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ESPN API data keys: %s", list(data) if data else None)
+        logger.debug(
+            "ESPN API items count: %d", len(data.get("items", [])) if data else 0
+        )
+
+    # Whether every listed event was fetched, so a miss can be trusted
+    details_complete = True
+
+    if data and data.get("items") and len(data["items"]) > 0:
+        # Find the closest upcoming game by following $ref URLs
+        upcoming_games = []
+        # ESPN dates are UTC, so one aware "now" serves every comparison
+        now_utc = datetime.now(timezone.utc)
+
+        # ESPN lists events in date order, so resolve them a batch at a time
+        # and stop once a batch has an upcoming game, later ones can't be closer
+        items = data["items"]
+        for batch_start in range(0, len(items), ESPN_EVENT_CONCURRENCY):
+            batch = items[batch_start : batch_start + ESPN_EVENT_CONCURRENCY]
+            events = await _fetch_event_details(batch)
+            if len(events) < len(batch):
+                details_complete = False
+            for event_data in events:
+                event_date_str = event_data.get("date", "")
+
+                if event_date_str:
+                    try:
+                        # Parse the event date (timezone-aware)
+                        event_date = parse_espn_date(event_date_str)
+                        # Check if the event is in the future
+                        if event_date > now_utc:
+                            logger.debug(
+                                "Found upcoming %s game on %s", team_name, event_date
+                            )
+                            upcoming_games.append((event_date, event_data))
+                    except Exception as e:
+                        logger.warning(f"Error parsing {team_name} event date: {e}")
+                        continue
+
+            if upcoming_games:
+                break
+
+        if upcoming_games:
+            # Get the closest upcoming game
+            closest_date, closest_game = min(upcoming_games, key=lambda x: x[0])
+            logger.info(
+                f"Found next {team_name} game: {closest_game.get('name', 'Unknown')} on {closest_game.get('date', 'TBD')}"
+            )
+
+            # Cache the result
+            await set_cached(cache_key, closest_game, "game_data")
+            return closest_game
+
+    logger.warning(f"No upcoming {team_name} games found")
+    if data is not None and details_complete:
+        # ESPN answered with nothing upcoming (e.g. off-season), so remember that
+        # briefly instead of repeating the lookup on every /nextgame. Failed
+        # event fetches aren't cached, the next call retries them
+        await set_cached(cache_key, {}, "game_data_miss")
+    return None
+
+
 async def _get_team_next_game(
     team_name: str, config: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
@@ -44,7 +218,8 @@ async def _get_team_next_game(
 
     Args:
         team_name: Name of the team (for logging and cache keys)
-        config: Team configuration containing sport, league, team_id, and days_ahead
+        config: Team configuration containing sport, league, team_id, days_ahead
+            and optionally the ESPN event limit
 
     Returns:
         Game data dictionary or None if no upcoming games found
@@ -64,70 +239,25 @@ async def _get_team_next_game(
         cache_key = game_data_key(team_name, config["sport"], start_date, end_date)
         cached_result = await get_cached(cache_key)
         if cached_result is not None:
-            logger.info(f"Returning cached {team_name} game data")
-            return cached_result
-
-        logger.info(f"Date range: {start_date} to {end_date}")
-
-        # ESPN API endpoint
-        url = f"http://sports.core.api.espn.com/v2/sports/{config['sport']}/leagues/{config['league']}/teams/{config['team_id']}/events"
-        params = {"dates": f"{start_date}-{end_date}", "limit": 10}
-
-        data = await get_json(url, params=params)
-        logger.debug(f"ESPN API data keys: {list(data.keys()) if data else 'None'}")
-        logger.debug(
-            f"ESPN API items count: {len(data.get('items', [])) if data else 0}"
+            if not cached_result:
+                logger.info(f"No upcoming {team_name} games (cached)")
+                return None
+            if not _game_has_started(cached_result):
+                logger.info(f"Returning cached {team_name} game data")
+                return cached_result
+
+            # The cached next game is underway, look up the one after it
+            logger.info(f"Cached {team_name} game has started, refreshing")
+            await delete_cached(cache_key)
+
+        # Concurrent requests for the same team share one ESPN fetch
+        return await single_flight(
+            cache_key,
+            lambda: _fetch_team_next_game(
+                team_name, config, start_date, end_date, cache_key
+            ),
         )
 
-        if data and data.get("items") and len(data["items"]) > 0:
-            # Find the closest upcoming game by following $ref URLs
-            upcoming_games = []
-
-            for item in data["items"]:
-                event_ref = item.get("$ref")
-                if event_ref:
-                    logger.debug(
-                        f"Fetching {team_name} event details from: {event_ref}"
-                    )
-                    event_data = await get_json(event_ref)
-                    if event_data:
-                        event_date_str = event_data.get("date", "")
-
-                        if event_date_str:
-                            try:
-                                # Parse the event date (make both timezone-aware)
-                                event_date = datetime.fromisoformat(
-                                    event_date_str.replace("Z", "+00:00")
-                                )
-                                # Make today timezone-aware for comparison
-                                today_aware = today.replace(tzinfo=event_date.tzinfo)
-                                # Check if the event is in the future
-                                if event_date > today_aware:
-                                    logger.debug(
-                                        f"Found upcoming {team_name} game on {event_date}"
-                                    )
-                                    upcoming_games.append((event_date, event_data))
-                            except Exception as e:
-                                logger.warning(
-                                    f"Error parsing {team_name} event date: {e}"
-                                )
-                                continue
-
-            if upcoming_games:
-                # Sort by date and get the closest upcoming game
-                upcoming_games.sort(key=lambda x: x[0])
-                closest_date, closest_game = upcoming_games[0]
-                logger.info(
-                    f"Found next {team_name} game: {closest_game.get('name', 'Unknown')} on {closest_game.get('date', 'TBD')}"
-                )
-
-                # Cache the result
-                await set_cached(cache_key, closest_game, "game_data")
-                return closest_game
-
-        logger.warning(f"No upcoming {team_name} games found")
-        return None
-
     except Exception as e:
         logger.error(f"Error fetching {team_name} game data: {e}")
         return None
@@ -138,11 +268,6 @@ async def get_galaxy_next_game():
     return await _get_team_next_game("galaxy", TEAM_CONFIG["galaxy"])
 
 
-async def get_galaxy_next_game_extended():
-    """Get LA Galaxy's next game with detailed information from ESPN API"""
-    return await _get_team_next_game("galaxy", TEAM_CONFIG["galaxy"])
-
-
 async def get_dodgers_next_game():
     """Get Los Angeles Dodgers' next game from ESPN API"""
     return await _get_team_next_game("dodgers", TEAM_CONFIG["dodgers"])
@@ -169,18 +294,10 @@ async def get_team_games_in_date_range(team_id, sport, league, start_date, end_d
         params = {"dates": f"{start_str}-{end_str}", "limit": 50}
 
         data = await get_json(url, params=params)
-        logger.debug(f"ESPN API response status: {200 if data else 'Failed'}")
+        logger.debug("ESPN API response status: %s", 200 if data else "Failed")
 
         if data:
-            games = []
-
-            if data.get("items"):
-                for item in data["items"]:
-                    event_ref = item.get("$ref")
-                    if event_ref:
-                        event_data = await get_json(event_ref)
-                        if event_data:
-                            games.append(event_data)
+            games = await _fetch_event_details(data.get("items") or [])
 
             logger.info(f"Found {len(games)} games for team {team_id}")
             return games
@@ -5,40 +5,40 @@ Handles all ESPN API calls related to team information
 
 import logging
 from api.http_client import get_json
-from api.cache import get_cached, set_cached, team_name_key
+from api.cache import get_or_set_cached, team_name_key
 
 logger = logging.getLogger(__name__)
 
 
-async def get_team_name_from_ref(team_ref):
-    """Get team name from ESPN team reference URL with caching"""
-    if not team_ref:
-        return "TBD"
-
-    # Check cache first
-    cache_key = team_name_key(team_ref)
-    cached_result = await get_cached(cache_key)
-    if cached_result is not None:
-        logger.debug(f"Returning cached team name for {team_ref}")
-        return cached_result
-
+async def _fetch_team_name(team_ref):
+    """Fetch a team's name from its ESPN reference URL, or None on failure"""
     try:
         team_data = await get_json(team_ref)
         if team_data:
             # Try different name fields in order of preference
-            team_name = (
+            return (
                 team_data.get("displayName")
                 or team_data.get("name")
                 or team_data.get("shortDisplayName")
                 or team_data.get("abbreviation")
                 or "TBD"
             )
-            # Cache the result
-            await set_cached(cache_key, team_name, "team_names")
-            return team_name
         else:
             logger.warning(f"Failed to fetch team data from {team_ref}")
     except Exception as e:
         logger.error(f"Error fetching team name from {team_ref}: {e}")
 
-    return "TBD"
+    return None
+
+
+async def get_team_name_from_ref(team_ref):
+    """Get team name from ESPN team reference URL with caching"""
+    if not team_ref:
+        return "TBD"
+
+    # Concurrent lookups of the same team (e.g. across a weekly schedule) share
+    # one request, and failures aren't cached so they're retried next time
+    team_name = await get_or_set_cached(
+        team_name_key(team_ref), lambda: _fetch_team_name(team_ref), "team_names"
+    )
+    return team_name or "TBD"
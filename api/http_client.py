@@ -5,12 +5,53 @@ Provides async HTTP functionality using aiohttp
 
 import aiohttp
 import asyncio
+import json
 import logging
-from typing import Optional, Dict, Any
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
 from contextlib import asynccontextmanager
 
+# Try to import orjson for faster response parsing (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Retry settings for rate-limited (429) and server error (5xx) responses
+MAX_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30  # seconds
+RETRY_JITTER = 0.25  # seconds
+
+# HEAD checks only need headers, so fail faster than full GET requests
+HEAD_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse a JSON body with orjson when available, else the stdlib"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize a JSON body with orjson when available, else the stdlib"""
+    # aiohttp encodes the serializer's result itself, so it must return str
+    return orjson.dumps(obj).decode() if ORJSON_AVAILABLE else json.dumps(obj)
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Delay before retrying, honoring Retry-After (in seconds) when present"""
+    try:
+        delay = float(response.headers.get("Retry-After", 2**attempt))
+    except ValueError:
+        # Retry-After may also be an HTTP date, fall back to exponential backoff
+        delay = 2**attempt
+    return min(delay + random.uniform(0, RETRY_JITTER), MAX_RETRY_DELAY)
+
 
 class HTTPClient:
     """Async HTTP client using aiohttp with connection pooling and proper error handling"""
@@ -18,23 +59,28 @@ class HTTPClient:
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
         self._connector: Optional[aiohttp.TCPConnector] = None
+        # Monotonic time until which each rate-limited host should not be called
+        self._blocked_until: Dict[str, float] = {}
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session with connection pooling"""
         if self._session is None or self._session.closed:
             # Create connector with connection pooling
             self._connector = aiohttp.TCPConnector(
-                limit=100,  # Total connection pool size
-                limit_per_host=30,  # Max connections per host
+                limit=32,  # Total connection pool size
+                limit_per_host=8,  # Max connections per host
                 ttl_dns_cache=300,  # DNS cache TTL in seconds
                 use_dns_cache=True,
+                keepalive_timeout=75,  # Reuse idle connections between commands
+                enable_cleanup_closed=True,  # Reclaim sockets closed mid-TLS-shutdown
             )
 
             # Create session with timeout and connector
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
+            timeout = aiohttp.ClientTimeout(total=10, connect=3)
             self._session = aiohttp.ClientSession(
                 connector=self._connector,
                 timeout=timeout,
+                json_serialize=dumps_json,
                 headers={
                     "User-Agent": "goobie-bot/1.0 (Discord Bot)",
                     "Accept": "application/json",
@@ -44,31 +90,86 @@ class HTTPClient:
 
         return self._session
 
+    async def _wait_for_host(self, host: str):
+        """Sleep until a host that rate-limited us is available again"""
+        blocked_until = self._blocked_until.get(host)
+        if blocked_until is None:
+            return
+
+        delay = blocked_until - time.monotonic()
+        if delay > 0:
+            logger.debug("Waiting %.2fs for rate-limited host %s", delay, host)
+            await asyncio.sleep(delay)
+        else:
+            self._blocked_until.pop(host, None)
+
     async def get(
-        self, url: str, params: Dict[str, Any] = None, **kwargs
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        rate_limiter=None,
+        on_response: Optional[Callable[[int, float], None]] = None,
+        **kwargs,
     ) -> Optional[Dict[str, Any]]:
-        """Make async GET request and return JSON data"""
+        """
+        Make async GET request and return JSON data, retrying 429 and 5xx
+
+        If given, rate_limiter.acquire() is awaited before every attempt, so
+        retries count against the caller's request budget too. on_response is
+        called with each attempt's status and latency, which excludes rate
+        limit and backoff waits.
+        """
         try:
             session = await self.get_session()
-            logger.debug(f"Making GET request to: {url} with params: {params}")
-
-            async with session.get(url, params=params, **kwargs) as response:
-                # Log response status
-                logger.debug(f"Response status: {response.status} for {url}")
-
-                if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"Successfully fetched data from {url}")
-                    return data
-                elif response.status == 429:
-                    logger.warning(f"Rate limited by {url} (429)")
-                    return None
-                elif response.status == 404:
-                    logger.warning(f"Resource not found at {url} (404)")
-                    return None
-                else:
-                    logger.warning(f"Unexpected status {response.status} from {url}")
-                    return None
+            host = urlsplit(url).netloc
+
+            for attempt in range(MAX_ATTEMPTS):
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                await self._wait_for_host(host)
+                logger.debug("Making GET request to: %s with params: %s", url, params)
+
+                attempt_start = time.monotonic()
+                async with session.get(url, params=params, **kwargs) as response:
+                    # Log response status
+                    logger.debug("Response status: %s for %s", response.status, url)
+                    if on_response is not None:
+                        on_response(response.status, time.monotonic() - attempt_start)
+
+                    if response.status == 200:
+                        data = loads_json(await response.read())
+                        logger.debug("Successfully fetched data from %s", url)
+                        return data
+                    elif response.status == 404:
+                        logger.warning(f"Resource not found at {url} (404)")
+                        return None
+                    elif response.status != 429 and response.status < 500:
+                        logger.warning(
+                            f"Unexpected status {response.status} from {url}"
+                        )
+                        return None
+
+                    if attempt == MAX_ATTEMPTS - 1:
+                        logger.warning(
+                            f"Giving up on {url} after {MAX_ATTEMPTS} attempts "
+                            f"(status {response.status})"
+                        )
+                        return None
+
+                    delay = _retry_delay(response, attempt)
+                    if response.status == 429:
+                        # Hold back other requests to this host too
+                        self._blocked_until[host] = time.monotonic() + delay
+                        logger.warning(
+                            f"Rate limited by {url} (429), retrying in {delay:.2f}s"
+                        )
+                    else:
+                        logger.warning(
+                            f"Server error {response.status} from {url}, "
+                            f"retrying in {delay:.2f}s"
+                        )
+
+                await asyncio.sleep(delay)
 
         except aiohttp.ClientError as e:
             logger.error(f"HTTP client error for {url}: {e}")
@@ -84,10 +185,13 @@ class HTTPClient:
         """Make async HEAD request to check if resource exists"""
         try:
             session = await self.get_session()
-            logger.debug(f"Making HEAD request to: {url}")
+            logger.debug("Making HEAD request to: %s", url)
 
+            kwargs.setdefault("timeout", HEAD_TIMEOUT)
+            # aiohttp doesn't follow redirects for HEAD by default, CDNs often redirect
+            kwargs.setdefault("allow_redirects", True)
             async with session.head(url, **kwargs) as response:
-                logger.debug(f"HEAD response status: {response.status} for {url}")
+                logger.debug("HEAD response status: %s for %s", response.status, url)
                 return response.status == 200
 
         except Exception as e:
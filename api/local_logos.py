@@ -3,11 +3,20 @@ Local logo handler for goobie-bot
 Handles pre-downloaded team logos stored in the container
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
 from typing import Dict, Optional
 
+# Try to import orjson for faster manifest parsing (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +38,13 @@ class LocalLogoManager:
 
     def __init__(self):
         self.manifest = self._load_manifest()
+        # Lowercased team names, built once for name lookups
+        self._team_name_index = [
+            (team_data.get("team_name", "").lower(), team_key)
+            for team_key, team_data in self.manifest.get("teams", {}).items()
+        ]
+        # Resolved logos per team key, the manifest and files don't change at runtime
+        self._team_logos: Dict[str, Optional[Dict[str, str]]] = {}
         self.base_url = (
             "https://your-bot-domain.com"  # Will be replaced with actual domain
         )
@@ -37,8 +53,9 @@ class LocalLogoManager:
         """Load the logo manifest file"""
         try:
             if MANIFEST_PATH.exists():
-                with open(MANIFEST_PATH, "r") as f:
-                    manifest = json.load(f)
+                with open(MANIFEST_PATH, "rb") as f:
+                    raw = f.read()
+                manifest = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 logger.info(
                     f"Loaded logo manifest with {len(manifest.get('teams', {}))} teams"
                 )
@@ -52,6 +69,12 @@ class LocalLogoManager:
 
     def get_team_logos(self, team_key: str) -> Optional[Dict[str, str]]:
         """Get logos for a team by key (galaxy, dodgers, lakers, rams, kings)"""
+        if team_key not in self._team_logos:
+            self._team_logos[team_key] = self._resolve_team_logos(team_key)
+        return self._team_logos[team_key]
+
+    def _resolve_team_logos(self, team_key: str) -> Optional[Dict[str, str]]:
+        """Resolve a team's logo URLs, checking the local files once"""
         team_data = self.manifest.get("teams", {}).get(team_key)
         if not team_data:
             logger.warning(f"No logo data found for team key: {team_key}")
@@ -84,48 +107,60 @@ class LocalLogoManager:
                     else:
                         logos[logo_type] = team_data[logo_type]
 
+        # Same shape as TheSportsDB logos: logo_small is always set when logo is
+        if logos.get("logo"):
+            logos.setdefault("logo_small", logos["logo"])
         return logos
 
     def get_team_logos_by_name(self, team_name: str) -> Optional[Dict[str, str]]:
         """Get logos for a team by name (fallback for unknown teams)"""
         # Try to match against known teams
-        for team_key, team_data in self.manifest.get("teams", {}).items():
-            if team_name.lower() in team_data.get("team_name", "").lower():
-                return self.get_team_logos(team_key)
+        needle = team_name.lower()
+        team_key = next(
+            (key for name, key in self._team_name_index if needle in name), None
+        )
+        if team_key:
+            return self.get_team_logos(team_key)
 
-        logger.warning(f"No logo found for team name: {team_name}")
+        # Expected for opponents, which callers look up elsewhere
+        logger.debug("No local logo found for team name: %s", team_name)
         return None
 
 
-# Global instance
-local_logo_manager = LocalLogoManager()
+@functools.lru_cache(maxsize=1)
+def get_local_logo_manager() -> LocalLogoManager:
+    """Get the global logo manager, loading the manifest on first use"""
+    return LocalLogoManager()
+
+
+def __getattr__(name):
+    """Keep `local_logo_manager` importable without loading it at import time"""
+    if name == "local_logo_manager":
+        return get_local_logo_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_local_team_logos(team_key: str) -> Optional[Dict[str, str]]:
     """Get local team logos by key"""
-    return local_logo_manager.get_team_logos(team_key)
+    return get_local_logo_manager().get_team_logos(team_key)
 
 
 def get_local_opponent_logo(opponent_name: str) -> Optional[str]:
     """Get local opponent logo by name"""
-    return local_logo_manager.get_opponent_logo(opponent_name)
+    return get_local_logo_manager().get_opponent_logo(opponent_name)
 
 
 def get_local_team_logos_by_name(team_name: str) -> Optional[Dict[str, str]]:
     """Get local team logos by name"""
-    return local_logo_manager.get_team_logos_by_name(team_name)
+    return get_local_logo_manager().get_team_logos_by_name(team_name)
 
 
-# Team key mappings for easy lookup
-TEAM_KEY_MAPPING = {
-    "galaxy": "galaxy",
-    "dodgers": "dodgers",
-    "lakers": "lakers",
-    "rams": "rams",
-    "kings": "kings",
-}
+# Team keys with logos in the manifest (Discord choice values are already team keys)
+KNOWN_TEAM_KEYS = frozenset({"galaxy", "dodgers", "lakers", "rams", "kings"})
 
 
 def get_team_key_from_choice(team_choice: str) -> str:
     """Get team key from Discord choice value"""
-    return TEAM_KEY_MAPPING.get(team_choice, team_choice)
+    if team_choice not in KNOWN_TEAM_KEYS:
+        logger.debug("Unknown team choice: %s", team_choice)
+    return team_choice
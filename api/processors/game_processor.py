@@ -3,15 +3,62 @@ Game processor module for goobie-bot
 Handles combining ESPN game data with TheSportsDB logos and creating Discord embeds
 """
 
+import asyncio
 import logging
-from datetime import datetime
+from functools import lru_cache
 import pytz
 import discord
 
 from api import get_team_name_from_ref, search_team_logos
+from api.espn.games import parse_espn_date
+from api.local_logos import get_local_team_logos_by_name
 
 logger = logging.getLogger(__name__)
 
+# Game times are shown in Pacific time
+PACIFIC_TZ = pytz.timezone("America/Los_Angeles")
+
+# Static game embed text
+GAME_EMBED_FOOTER = "Go LA!"
+DATE_FIELD_NAME = "📅 Date & Time"
+VENUE_FIELD_NAME = "🏟️ Venue"
+
+# %Z renders PST or PDT from the converted time, so one format covers both
+GAME_DATE_FORMAT = "%A, %B %d, %Y at %I:%M %p %Z"
+
+# Shared default for chained .get() lookups (never mutated)
+_EMPTY_DICT: dict = {}
+
+# Embed (emoji, color) per team key, matched against the team name
+EMBED_TEAM_STYLES = {
+    "dodgers": ("⚾", 0x005A9C),
+    "lakers": ("🏀", 0x552583),
+    "rams": ("🏈", 0xFFD700),
+    "kings": ("🏒", 0xA2AAAD),
+    "galaxy": ("⚽", 0x00245D),
+}
+
+
+async def _get_competitor_logos(competitor):
+    """Get (team name, logos) for one competitor, or None if unavailable"""
+    team_ref = competitor.get("team", _EMPTY_DICT).get("$ref")
+    if not team_ref:
+        return None
+
+    # Get team name and search for logos
+    team_name = await get_team_name_from_ref(team_ref)
+    logger.debug("Getting logos for team: %s", team_name)
+
+    # Logos already in the local manifest don't need a TheSportsDB round trip
+    team_logos = get_local_team_logos_by_name(team_name)
+    if not team_logos:
+        team_logos = await search_team_logos(team_name)
+    if not team_logos:
+        return None
+
+    logger.debug("Found logos for %s: %s", team_name, team_logos)
+    return team_name, team_logos
+
 
 async def get_game_logos(game_data):
     """Get logos for both teams and venue from TheSportsDB"""
@@ -24,18 +71,11 @@ async def get_game_logos(game_data):
             competition = competitions[0]
             competitors = competition.get("competitors", [])
 
-            for competitor in competitors:
-                team_ref = competitor.get("team", {}).get("$ref")
-                if team_ref:
-                    # Get team name and search for logos
-                    team_name = await get_team_name_from_ref(team_ref)
-                    logger.debug(f"Getting logos for team: {team_name}")
-
-                    # Search TheSportsDB for this team
-                    team_logos = await search_team_logos(team_name)
-                    if team_logos:
-                        logos[team_name] = team_logos
-                        logger.debug(f"Found logos for {team_name}: {team_logos}")
+            # Look up both teams concurrently, they don't depend on each other
+            results = await asyncio.gather(
+                *(_get_competitor_logos(competitor) for competitor in competitors)
+            )
+            logos.update(result for result in results if result)
 
         # Note: Venue/stadium image fetching removed for now
 
@@ -46,96 +86,94 @@ async def get_game_logos(game_data):
         return {}
 
 
+@lru_cache(maxsize=32)
+def _build_game_embed(team_name, style, logo_url, game_date, game_name, venue_name):
+    """Build the embed for a game (cached, callers must copy before changing it)"""
+    emoji, color = style
+
+    # Create embed
+    embed = discord.Embed(title=f"{team_name} Next Game", color=color)
+
+    # Add team logo as thumbnail if available
+    if logo_url:
+        embed.set_thumbnail(url=logo_url)
+
+    # Parse and add game date
+    if game_date:
+        try:
+            game_date_utc = parse_espn_date(game_date)
+            # Convert to Pacific Time
+            game_date_pacific = game_date_utc.astimezone(PACIFIC_TZ)
+            formatted_date = game_date_pacific.strftime(GAME_DATE_FORMAT)
+            # Truncate if too long for Discord embed
+            if len(formatted_date) > 1024:
+                formatted_date = formatted_date[:1021] + "..."
+            embed.add_field(name=DATE_FIELD_NAME, value=formatted_date, inline=False)
+        except Exception as e:
+            logger.warning(f"Error parsing date: {e}")
+            embed.add_field(name=DATE_FIELD_NAME, value=game_date, inline=False)
+
+    # Add game name
+    if game_name:
+        if len(game_name) > 1024:
+            game_name = game_name[:1021] + "..."
+        embed.add_field(name=f"{emoji} Match", value=game_name, inline=False)
+
+    # Add venue information
+    if venue_name:
+        if len(venue_name) > 1024:
+            venue_name = venue_name[:1021] + "..."
+        embed.add_field(name=VENUE_FIELD_NAME, value=venue_name, inline=True)
+
+    # Add footer
+    embed.set_footer(text=GAME_EMBED_FOOTER)
+
+    return embed
+
+
 async def create_game_embed(game_data, logos, team_name=None):
     """Create a Discord embed for the game data"""
     try:
-        # Team configuration mapping for quick lookup
-        TEAM_CONFIG = {
-            "dodgers": {"emoji": "⚾", "color": 0x005A9C},
-            "lakers": {"emoji": "🏀", "color": 0x552583},
-            "rams": {"emoji": "🏈", "color": 0xFFD700},
-            "kings": {"emoji": "🏒", "color": 0xA2AAAD},
-            "galaxy": {"emoji": "⚽", "color": 0x00245D},
-        }
-
         # Determine team name and configuration
         if not team_name:
             # Use first available team from logos or default to Galaxy
-            team_name = list(logos.keys())[0] if logos else "LA Galaxy"
-
-        # Find team configuration by matching team name
-        team_key = None
-        for key, config in TEAM_CONFIG.items():
-            if key in team_name.lower():
-                team_key = key
-                break
+            team_name = next(iter(logos), "LA Galaxy")
+
+        # Find team style by matching team name (lowercased once)
+        team_name_lower = team_name.lower()
+        style = next(
+            (
+                team_style
+                for key, team_style in EMBED_TEAM_STYLES.items()
+                if key in team_name_lower
+            ),
+            None,
+        )
 
         # Default to Galaxy if no match found
-        if not team_key:
-            team_key = "galaxy"
+        if style is None:
+            style = EMBED_TEAM_STYLES["galaxy"]
             team_name = "LA Galaxy"
 
-        config = TEAM_CONFIG[team_key]
-        emoji = config["emoji"]
-        color = config["color"]
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"{team_name} Next Game",
-            color=color,
-            timestamp=datetime.now(),
+        team_logos = logos.get(team_name, _EMPTY_DICT)
+        competitions = game_data.get("competitions")
+        venue_name = (
+            competitions[0].get("venue", _EMPTY_DICT).get("fullName", "")
+            if competitions
+            else ""
         )
 
-        # Add team logo as thumbnail if available
-        team_logos = logos.get(team_name, {})
-        if team_logos.get("logo"):
-            embed.set_thumbnail(url=team_logos["logo"])
-
-        # Parse and add game date
-        if game_data.get("date"):
-            try:
-                game_date = datetime.fromisoformat(
-                    game_data["date"].replace("Z", "+00:00")
-                )
-                # Convert to Pacific Time
-                pacific_tz = pytz.timezone("America/Los_Angeles")
-                game_date_pacific = game_date.astimezone(pacific_tz)
-                formatted_date = game_date_pacific.strftime(
-                    "%A, %B %d, %Y at %I:%M %p %Z"
-                )
-                # Truncate if too long for Discord embed
-                if len(formatted_date) > 1024:
-                    formatted_date = formatted_date[:1021] + "..."
-                embed.add_field(
-                    name="📅 Date & Time", value=formatted_date, inline=False
-                )
-            except Exception as e:
-                logger.warning(f"Error parsing date: {e}")
-                embed.add_field(
-                    name="📅 Date & Time",
-                    value=game_data.get("date", "TBD"),
-                    inline=False,
-                )
-
-        # Add game name
-        if game_data.get("name"):
-            game_name = game_data["name"]
-            if len(game_name) > 1024:
-                game_name = game_name[:1021] + "..."
-            embed.add_field(name=f"{emoji} Match", value=game_name, inline=False)
-
-        # Add venue information
-        competitions = game_data.get("competitions", [])
-        if competitions:
-            venue_name = competitions[0].get("venue", {}).get("fullName", "")
-            if venue_name:
-                if len(venue_name) > 1024:
-                    venue_name = venue_name[:1021] + "..."
-                embed.add_field(name="🏟️ Venue", value=venue_name, inline=True)
-
-        # Add footer
-        embed.set_footer(text="Go LA!")
-
+        # Identical games render identically, so reuse the built embed and only
+        # refresh the timestamp on a copy
+        embed = _build_game_embed(
+            team_name,
+            style,
+            team_logos.get("logo"),
+            game_data.get("date"),
+            game_data.get("name"),
+            venue_name,
+        ).copy()
+        embed.timestamp = discord.utils.utcnow()
         return embed
 
     except Exception as e:
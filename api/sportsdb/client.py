@@ -0,0 +1,162 @@
+"""
+TheSportsDB client module for goobie-bot
+Rate-limits all TheSportsDB API calls to stay within the free tier
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+from api.http_client import get_json
+
+logger = logging.getLogger(__name__)
+
+SPORTSDB_BASE_URL = "https://www.thesportsdb.com/api/v1/json/123"
+
+# Free tier allows 30 requests per minute, paid keys can raise it
+SPORTSDB_RATE_LIMIT = int(os.getenv("SPORTSDB_RATE_LIMIT", "30"))
+SPORTSDB_RATE_PERIOD = 60
+
+# Concurrency adapts between these bounds based on observed responses
+SPORTSDB_MIN_CONCURRENCY = 2
+SPORTSDB_MAX_CONCURRENCY = 8
+SPORTSDB_TARGET_LATENCY = 2.0  # seconds
+
+
+class RateLimiter:
+    """Async sliding-window rate limiter allowing max_rate acquisitions per period"""
+
+    def __init__(self, max_rate: int, period: float):
+        self.max_rate = max_rate
+        self.period = period
+        self._timestamps = deque()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Create the lock lazily so it binds to the running event loop"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def acquire(self):
+        """Wait until a request slot is free in the current window"""
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_rate:
+                    self._timestamps.append(now)
+                    return
+
+                delay = self.period - (now - self._timestamps[0])
+                logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class AIMDConcurrencyLimiter:
+    """
+    Concurrency limit with additive increase / multiplicative decrease
+
+    The limit grows by 0.5 after each fast successful request and halves
+    after a failed or slow one, staying between min_limit and max_limit.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, target_latency: float):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self._limit = float(min_limit)
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so it binds to the running event loop"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    async def acquire(self):
+        """Wait until the number of in-flight requests is below the limit"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, latency: float, success: bool):
+        """Release a slot and adjust the limit from the request's outcome"""
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            previous = self.limit
+            if success and latency <= self.target_latency:
+                self._limit = min(self.max_limit, self._limit + 0.5)
+            else:
+                self._limit = max(self.min_limit, self._limit * 0.5)
+
+            if self.limit != previous:
+                logger.debug(f"SportsDB concurrency limit {previous} -> {self.limit}")
+            condition.notify_all()
+
+
+# Shared limits for every TheSportsDB request
+sportsdb_limiter = RateLimiter(SPORTSDB_RATE_LIMIT, SPORTSDB_RATE_PERIOD)
+sportsdb_concurrency = AIMDConcurrencyLimiter(
+    SPORTSDB_MIN_CONCURRENCY, SPORTSDB_MAX_CONCURRENCY, SPORTSDB_TARGET_LATENCY
+)
+
+
+async def get_sportsdb_json(
+    endpoint: str, params: Dict[str, Any] = None
+) -> Optional[Dict[str, Any]]:
+    """GET a TheSportsDB endpoint (e.g. "searchteams.php") within the rate limit"""
+    # (status, latency) of each HTTP attempt, without rate limit or backoff waits
+    attempts = []
+    await sportsdb_concurrency.acquire()
+    data = None
+    try:
+        # One rate limit slot per attempt, so retried 429s and 5xx count too
+        data = await get_json(
+            f"{SPORTSDB_BASE_URL}/{endpoint}",
+            params=params,
+            rate_limiter=sportsdb_limiter,
+            on_response=lambda status, latency: attempts.append((status, latency)),
+        )
+        return data
+    finally:
+        # A timeout records no attempt, and any retried 429 or 5xx is a failure
+        success = bool(attempts) and all(status == 200 for status, _ in attempts)
+        latency = max((latency for _, latency in attempts), default=0.0)
+        await sportsdb_concurrency.release(latency, success and data is not None)
+
+
+def first_match(
+    data: Optional[Dict[str, Any]], collection: str, predicate: Callable
+) -> Optional[Dict[str, Any]]:
+    """Return the first item in a response collection (e.g. "teams") that matches"""
+    if not data:
+        return None
+    return next((item for item in data.get(collection) or () if predicate(item)), None)
+
+
+async def search_sportsdb(
+    kind: str, name: str, predicate: Callable
+) -> Optional[Dict[str, Any]]:
+    """Search TheSportsDB "teams" or "venues" by name and return the first match"""
+    data = await get_sportsdb_json(f"search{kind}.php", params={"t": name})
+    return first_match(data, kind, predicate)
@@ -0,0 +1,63 @@
+"""
+Static TheSportsDB data for the LA teams
+Logos that never change at runtime, served without I/O
+Team records live in api/team_config.py
+"""
+
+from types import MappingProxyType
+
+# Hardcoded logos for LA teams by TheSportsDB team ID (used for reliability)
+LA_TEAM_LOGOS = MappingProxyType(
+    {
+        "134153": {  # LA Galaxy
+            "logo": "https://r2.thesportsdb.com/images/media/team/badge/ysyysr1420227188.png",
+            "logo_small": "https://r2.thesportsdb.com/images/media/team/badge/ysyysr1420227188.png/small",
+            "jersey": "https://www.thesportsdb.com/images/media/team/equipment/ysyysr1420227188.png",
+            "stadium": "Dignity Health Sports Park",
+            "stadium_thumb": "https://www.thesportsdb.com/images/media/venue/thumb/15529.jpg",
+            "stadium_thumb_small": "https://www.thesportsdb.com/images/media/venue/thumb/15529.jpg/small",
+        },
+        "1416": {  # Los Angeles Dodgers
+            "logo": "https://a.espncdn.com/i/teamlogos/mlb/500/19.png",
+            "logo_small": "https://a.espncdn.com/i/teamlogos/mlb/500/19.png",
+            "jersey": "https://a.espncdn.com/i/teamlogos/mlb/500/19.png",
+            "stadium": "Dodger Stadium",
+            "stadium_thumb": "https://a.espncdn.com/i/teamlogos/mlb/500/19.png",
+            "stadium_thumb_small": "https://a.espncdn.com/i/teamlogos/mlb/500/19.png",
+        },
+        "134154": {  # Los Angeles Lakers
+            "logo": "https://a.espncdn.com/i/teamlogos/nba/500/13.png",
+            "logo_small": "https://a.espncdn.com/i/teamlogos/nba/500/13.png",
+            "jersey": "https://a.espncdn.com/i/teamlogos/nba/500/13.png",
+            "stadium": "Crypto.com Arena",
+            "stadium_thumb": "https://a.espncdn.com/i/teamlogos/nba/500/13.png",
+            "stadium_thumb_small": "https://a.espncdn.com/i/teamlogos/nba/500/13.png",
+        },
+        "135907": {  # Los Angeles Rams
+            "logo": "https://a.espncdn.com/i/teamlogos/nfl/500/14.png",
+            "logo_small": "https://a.espncdn.com/i/teamlogos/nfl/500/14.png",
+            "jersey": "https://a.espncdn.com/i/teamlogos/nfl/500/14.png",
+            "stadium": "SoFi Stadium",
+            "stadium_thumb": "https://a.espncdn.com/i/teamlogos/nfl/500/14.png",
+            "stadium_thumb_small": "https://a.espncdn.com/i/teamlogos/nfl/500/14.png",
+        },
+        "134852": {  # Los Angeles Kings
+            "logo": "https://a.espncdn.com/i/teamlogos/nhl/500/8.png",
+            "logo_small": "https://a.espncdn.com/i/teamlogos/nhl/500/8.png",
+            "jersey": "https://a.espncdn.com/i/teamlogos/nhl/500/8.png",
+            "stadium": "Crypto.com Arena",
+            "stadium_thumb": "https://a.espncdn.com/i/teamlogos/nhl/500/8.png",
+            "stadium_thumb_small": "https://a.espncdn.com/i/teamlogos/nhl/500/8.png",
+        },
+    }
+)
+
+LA_TEAM_NAMES = MappingProxyType(
+    {
+        "134153": "LA Galaxy",
+        "1416": "Los Angeles Dodgers",
+        "134154": "Los Angeles Lakers",
+        "135907": "Los Angeles Rams",
+        "134852": "Los Angeles Kings",
+    }
+)
@@ -3,13 +3,33 @@ TheSportsDB Venues API module for goobie-bot
 Handles all TheSportsDB API calls related to venue information and images
 """
 
+import asyncio
 import logging
-from api.http_client import get_json
-from api.cache import get_cached, set_cached, venue_data_key
+from api.cache import get_cached, set_cached, single_flight, venue_data_key
+from .client import search_sportsdb
 
 logger = logging.getLogger(__name__)
 
 
+async def _fetch_venue_logos(venue_name, cache_key):
+    """Search TheSportsDB for a venue and cache the match"""
+    needle = venue_name.casefold()
+    venue = await search_sportsdb(
+        "venues", venue_name, lambda v: needle in (v.get("strVenue") or "").casefold()
+    )
+    if not venue:
+        return {}
+
+    venue_data = {
+        "venue_name": venue.get("strVenue", ""),
+        "venue_thumb": venue.get("strVenueThumb", ""),
+        "venue_image": venue.get("strVenueImage", ""),
+    }
+    # Cache the result
+    await set_cached(cache_key, venue_data, "venue_data")
+    return venue_data
+
+
 async def search_venue_logos(venue_name):
     """Search TheSportsDB for venue logos"""
     try:
@@ -17,25 +37,24 @@ async def search_venue_logos(venue_name):
         cache_key = venue_data_key(venue_name)
         cached_result = await get_cached(cache_key)
         if cached_result is not None:
-            logger.info(f"Returning cached venue data for: {venue_name}")
+            logger.debug("Returning cached venue data for: %s", venue_name)
             return cached_result
 
-        search_url = "https://www.thesportsdb.com/api/v1/json/123/searchvenues.php"
-        search_params = {"t": venue_name}
-
-        data = await get_json(search_url, params=search_params)
-        if data and data.get("venues"):
-            for venue in data["venues"]:
-                if venue_name.lower() in venue.get("strVenue", "").lower():
-                    venue_data = {
-                        "venue_name": venue.get("strVenue", ""),
-                        "venue_thumb": venue.get("strVenueThumb", ""),
-                        "venue_image": venue.get("strVenueImage", ""),
-                    }
-                    # Cache the result
-                    await set_cached(cache_key, venue_data, "venue_data")
-                    return venue_data
-        return {}
+        # Concurrent lookups of the same venue share one request
+        return await single_flight(
+            cache_key, lambda: _fetch_venue_logos(venue_name, cache_key)
+        )
     except Exception as e:
         logger.error(f"Error searching venue logos for {venue_name}: {e}")
         return {}
+
+
+async def warm_venue_cache(venue_names):
+    """Prefetch venue data concurrently so later lookups hit the cache"""
+    unique_names = list(dict.fromkeys(venue_names))
+    results = await asyncio.gather(
+        *(search_venue_logos(name) for name in unique_names)
+    )
+    logger.info(
+        f"Warmed cache for {sum(1 for r in results if r)}/{len(unique_names)} venues"
+    )
@@ -8,6 +8,15 @@ License: MIT
 """
 
 import asyncio
+
+# Try to import uvloop for a faster event loop (optional, not on Windows or armv7)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from config import (
     DISCORD_TOKEN,
     WEEKLY_NOTIFICATIONS_CHANNEL_ID,
@@ -22,7 +31,6 @@ from config import (
 )
 from events import (
     on_ready as ready_handler,
-    on_message as message_handler,
     on_command_error as command_error_handler,
     on_app_command_error as app_command_error_handler,
 )
@@ -39,7 +47,8 @@ from facts.simple_commands import (
     fact_search_text_command,
 )
 from facts.simple_scheduler import schedule_daily_facts
-from api.http_client import cleanup_http_client
+from api import warm_venue_cache
+from api.team_config import TEAM_CONFIG, TEAM_DATA
 from api.cache import cache_cleanup_task
 
 # Set up logging
@@ -73,24 +82,26 @@ async def on_ready():
         "daily_facts", schedule_daily_facts, bot, FACTS_CHANNEL_ID
     )
 
-    # Start cache cleanup task
-    logger.info("Starting cache cleanup task...")
-    asyncio.create_task(cache_cleanup_task())
+    # Prefetch LA team venues and every team's next game together, they're
+    # independent, so scheduler ticks and the first /nextgame hit the cache
+    await asyncio.gather(
+        warm_venue_cache(team["strStadium"] for team in TEAM_DATA.values()),
+        *(team["game_func"]() for team in TEAM_CONFIG.values()),
+    )
+
+    # Start cache cleanup task (tracked so reconnects don't duplicate it)
+    await scheduler_manager.start_scheduler("cache_cleanup", cache_cleanup_task)
 
     # Start resource monitoring if in Pi mode
     if PI_MODE:
-        logger.info("Starting Pi resource monitoring...")
-        asyncio.create_task(monitor_resources_periodically(bot))
+        await scheduler_manager.start_scheduler(
+            "resource_monitor", monitor_resources_periodically, bot
+        )
         logger.info(
             f"🤖 Pi mode enabled - Memory limit: {MEMORY_LIMIT_MB}MB, Cache limit: {CACHE_SIZE_LIMIT} entries"
         )
 
 
-@bot.event
-async def on_message(message):
-    await message_handler(bot, message)
-
-
 @bot.event
 async def on_command_error(ctx, error):
     await command_error_handler(ctx, error)
@@ -101,20 +112,37 @@ async def on_app_command_error(interaction, error):
     await app_command_error_handler(interaction, error)
 
 
-# Register slash commands
-bot.tree.add_command(nextgame_command)
-bot.tree.add_command(weekly_command)
-bot.tree.add_command(trivia_command)
-bot.tree.add_command(fact_command)
+# Slash commands
+SLASH_COMMANDS = (
+    nextgame_command,
+    weekly_command,
+    trivia_command,
+    fact_command,
+)
+
+# Text commands
+TEXT_COMMANDS = (
+    test_command,
+    sync_command,
+    cache_command,
+    trivia_admin_command,
+    trigger_trivia_command,
+    fact_stats_text_command,
+    fact_search_text_command,
+)
+
+# Register commands, skipping any that fail so the rest still load
+for command in SLASH_COMMANDS:
+    try:
+        bot.tree.add_command(command)
+    except Exception as e:
+        logger.error(f"❌ Failed to register slash command {command.name}: {e}")
 
-# Register text commands
-bot.add_command(test_command)
-bot.add_command(sync_command)
-bot.add_command(cache_command)
-bot.add_command(trivia_admin_command)
-bot.add_command(trigger_trivia_command)
-bot.add_command(fact_stats_text_command)
-bot.add_command(fact_search_text_command)
+for command in TEXT_COMMANDS:
+    try:
+        bot.add_command(command)
+    except Exception as e:
+        logger.error(f"❌ Failed to register text command {command.name}: {e}")
 
 
 # Run the bot with the token from the .env file
@@ -122,18 +150,15 @@ if __name__ == "__main__":
     if DISCORD_TOKEN:
         logger.info("🤖 Starting goobie-bot...")
         logger.info("🔑 Discord Token found")
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("⚡ Using uvloop event loop")
         try:
-            bot.run(DISCORD_TOKEN)
+            # Logging is already configured by setup_logging()
+            bot.run(DISCORD_TOKEN, log_handler=None)
         except KeyboardInterrupt:
             logger.info("🛑 Bot stopped by user")
         except Exception as e:
-            logger.error(f"❌ Bot crashed: {e}")
-            import traceback
-
-            traceback.print_exc()
-        finally:
-            # Cleanup HTTP client
-            logger.info("🧹 Cleaning up HTTP client...")
-            asyncio.run(cleanup_http_client())
+            logger.exception(f"❌ Bot crashed: {e}")
     else:
         logger.error("❌ No Discord token found! Please check your .env file")
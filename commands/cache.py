@@ -145,10 +145,7 @@ async def cache_command(ctx, action: str = None):
         logger.info(f"Cache command completed successfully for {action}")
 
     except Exception as e:
-        logger.error(f"Error in cache command: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Error in cache command: {e}")
         await ctx.send("❌ An error occurred while managing cache")
 
 
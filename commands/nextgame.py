@@ -6,42 +6,47 @@ import discord
 from discord import app_commands
 import logging
 from api import create_game_embed
-from api.local_logos import get_local_team_logos, get_team_key_from_choice
-from api.team_config import get_team_config
+from api.local_logos import get_local_team_logos
+from api.team_config import TEAM_CONFIG, get_default_logos, get_team_config
 
 logger = logging.getLogger(__name__)
 
+# Built once from the team table so choices can't drift from the configured teams
+TEAM_CHOICES = [
+    app_commands.Choice(name=team_key.capitalize(), value=team_key)
+    for team_key in TEAM_CONFIG
+]
+
+
+def _resolve_logos(team_key: str):
+    """Return logos from the first source that has any for the team"""
+    # Local manifest first, then the team's precomputed default logo
+    return get_local_team_logos(team_key) or get_default_logos(team_key)
+
 
 @app_commands.command(name="nextgame", description="Get the next game for a team")
-@app_commands.choices(
-    team=[
-        app_commands.Choice(name="Galaxy", value="galaxy"),
-        app_commands.Choice(name="Dodgers", value="dodgers"),
-        app_commands.Choice(name="Lakers", value="lakers"),
-        app_commands.Choice(name="Rams", value="rams"),
-        app_commands.Choice(name="Kings", value="kings"),
-    ]
-)
+@app_commands.choices(team=TEAM_CHOICES)
 async def nextgame_command(
     interaction: discord.Interaction, team: app_commands.Choice[str]
 ):
     """Get the next game for a specified team"""
+    # Acknowledge first so nothing below can miss Discord's 3-second window
+    await interaction.response.defer(thinking=True)
     logger.info(
         f"Nextgame command triggered by {interaction.user} for team: {team.value}"
     )
-    await interaction.response.defer()
 
     try:
-        # Get team configuration (no API call required)
-        team_key = get_team_key_from_choice(team.value)
+        # Choice values are team keys, so this is a single table lookup
+        team_key = team.value
         team_config = get_team_config(team_key)
 
         if not team_config:
             await interaction.followup.send(f"❌ Unknown team: {team.value}")
             return
 
-        team_name = team_config.get("name", "Unknown Team")
-        game_data_func = team_config.get("game_func")
+        team_name = team_config["name"]
+        game_data_func = team_config["game_func"]
 
         # Get next game from ESPN API
         logger.info(f"Fetching next {team_name} game data...")
@@ -53,18 +58,15 @@ async def nextgame_command(
             )
             return
 
-        # Get logos from local storage (includes built-in fallbacks)
-        local_logos = get_local_team_logos(team_key)
-        logos = {team_name: local_logos} if local_logos else {team_name: {}}
+        logos = {team_name: _resolve_logos(team_key)}
 
         # Create rich embed
         embed = await create_game_embed(game_data, logos, team_name)
-        await interaction.followup.send(embed=embed)
+        # Throttle ourselves rather than stall on Discord's 429s during bursts
+        async with interaction.client.followup_semaphore:
+            await interaction.followup.send(embed=embed)
         logger.info(f"{team_name} nextgame command completed successfully")
 
     except Exception as e:
-        logger.error(f"Error in nextgame command: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Error in nextgame command: {e}")
         await interaction.followup.send("❌ An error occurred while fetching game data")
@@ -2,8 +2,11 @@
 Sync command implementation
 """
 
+import discord
 from discord.ext import commands
 import logging
+from config import DEV_GUILD_ID
+from utils.command_sync import sync_commands
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +16,8 @@ async def sync_command(ctx):
     """Force sync slash commands"""
     try:
         await ctx.send("Syncing commands...")
-        synced = await ctx.bot.tree.sync()
+        guild = discord.Object(id=DEV_GUILD_ID) if DEV_GUILD_ID else None
+        synced = await sync_commands(ctx.bot, guild)
         await ctx.send(f"Synced {len(synced)} commands: {[cmd.name for cmd in synced]}")
         logger.info(f"Manual sync: {len(synced)} commands")
     except Exception as e:
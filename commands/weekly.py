@@ -12,11 +12,27 @@ from datetime import datetime, timedelta
 import pytz
 from typing import Dict, List, Any, Tuple
 
-from scheduler.weekly_matches import get_weekly_matches_for_team
+from scheduler.weekly_matches import (
+    WEEKLY_DATE_FORMAT,
+    WEEKLY_EMBED_COLOR,
+    WEEKLY_EMBED_FOOTER,
+    WEEKLY_EMBED_THUMBNAIL,
+    WEEKLY_EMBED_TITLE,
+    WEEKLY_TIME_FORMAT,
+    find_opponent,
+    get_la_team_id,
+    get_weekly_matches_for_team,
+    prefetch_opponent_names,
+)
 from api.cache import get_cached, set_cached
+from api.espn.games import parse_espn_date
+from api.espn.teams import get_team_name_from_ref
 
 logger = logging.getLogger(__name__)
 
+# Weekly schedules are built in Pacific time
+PACIFIC_TZ = pytz.timezone("America/Los_Angeles")
+
 # Team configuration for weekly matches
 WEEKLY_TEAMS = [
     {"name": "Dodgers", "id": 19, "sport": "baseball", "league": "mlb", "emoji": "⚾"},
@@ -28,8 +44,7 @@ WEEKLY_TEAMS = [
 
 async def get_weekly_cache_key() -> str:
     """Generate cache key for weekly matches data"""
-    pacific_tz = pytz.timezone("America/Los_Angeles")
-    now_pacific = datetime.now(pacific_tz)
+    now_pacific = datetime.now(PACIFIC_TZ)
     days_since_monday = now_pacific.weekday()
     week_start = now_pacific - timedelta(days=days_since_monday)
     week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -96,24 +111,21 @@ async def create_optimized_weekly_embed(
     """Create an optimized weekly matches embed"""
     try:
         # Calculate week boundaries
-        pacific_tz = pytz.timezone("America/Los_Angeles")
-        now_pacific = datetime.now(pacific_tz)
+        now_pacific = datetime.now(PACIFIC_TZ)
         days_since_monday = now_pacific.weekday()
         week_start = now_pacific - timedelta(days=days_since_monday)
         week_end = week_start + timedelta(days=6)
 
         # Create embed
         embed = discord.Embed(
-            title="🏆 LA Teams Weekly Schedule",
+            title=WEEKLY_EMBED_TITLE,
             description=f"**📅 Week of {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}**\n\n",
-            color=0x00923F,
-            timestamp=datetime.now(),
+            color=WEEKLY_EMBED_COLOR,
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add thumbnail
-        embed.set_thumbnail(
-            url="https://raw.githubusercontent.com/kay-rey/goobie-bot/main/assets/goobies/goobieheadclear.png"
-        )
+        embed.set_thumbnail(url=WEEKLY_EMBED_THUMBNAIL)
 
         # Calculate total games
         total_games = sum(len(games) for games in team_games.values())
@@ -137,22 +149,26 @@ async def create_optimized_weekly_embed(
             ("🏀 Lakers", team_games.get("Lakers", [])),
             ("🏈 Rams", team_games.get("Rams", [])),
         ]
+        await prefetch_opponent_names(teams_data)
 
         for team_name, games in teams_data:
             if games:
                 # Create detailed game information for each team
                 game_details = []
+                current_team_id = get_la_team_id(team_name)
 
                 for i, game in enumerate(games[:5]):  # Show up to 5 games per team
                     try:
                         # Parse game date
                         if game.get("date"):
-                            game_date = datetime.fromisoformat(
-                                game["date"].replace("Z", "+00:00")
+                            game_date = parse_espn_date(game["date"])
+                            game_date_pacific = game_date.astimezone(PACIFIC_TZ)
+                            formatted_date = game_date_pacific.strftime(
+                                WEEKLY_DATE_FORMAT
+                            )
+                            formatted_time = game_date_pacific.strftime(
+                                WEEKLY_TIME_FORMAT
                             )
-                            game_date_pacific = game_date.astimezone(pacific_tz)
-                            formatted_date = game_date_pacific.strftime("%a, %b %d")
-                            formatted_time = game_date_pacific.strftime("%I:%M %p PT")
                         else:
                             formatted_date = "TBD"
                             formatted_time = "TBD"
@@ -165,51 +181,22 @@ async def create_optimized_weekly_embed(
                             competition = competitions[0]
                             competitors = competition.get("competitors", [])
 
-                            # Define our LA team IDs
-                            la_team_ids = {
-                                "dodgers": "19",
-                                "lakers": "13",
-                                "galaxy": "187",
-                                "rams": "14",
-                            }
-
-                            # Get the current team ID based on team name
-                            current_team_id = None
-                            for team_key, team_id in la_team_ids.items():
-                                if team_key in team_name.lower():
-                                    current_team_id = team_id
-                                    break
-
+                            # The opponent is the first team that isn't our LA team
+                            competitor = None
                             if len(competitors) >= 2 and current_team_id:
-                                # Find which team is the opponent (not our LA team)
-                                for competitor in competitors:
-                                    competitor_id = competitor.get("id", "")
-                                    competitor_home_away = competitor.get(
-                                        "homeAway", ""
-                                    )
-
-                                    # If this is NOT our LA team, it's the opponent
-                                    if competitor_id != current_team_id:
-                                        # Get opponent name from team reference URL
-                                        team_ref = competitor.get("team", {}).get(
-                                            "$ref", ""
-                                        )
-                                        if team_ref:
-                                            from api.espn.teams import (
-                                                get_team_name_from_ref,
-                                            )
-
-                                            opponent = await get_team_name_from_ref(
-                                                team_ref
-                                            )
-
-                                        # Determine if LA team is home or away
-                                        home_away = (
-                                            "vs"
-                                            if competitor_home_away == "away"
-                                            else "@"
-                                        )
-                                        break
+                                competitor = find_opponent(competitors, current_team_id)
+
+                            if competitor:
+                                # Get opponent name from team reference URL
+                                team_ref = competitor.get("team", {}).get("$ref", "")
+                                if team_ref:
+                                    opponent = await get_team_name_from_ref(team_ref)
+
+                                # Determine if LA team is home or away
+                                competitor_home_away = competitor.get("homeAway", "")
+                                home_away = (
+                                    "vs" if competitor_home_away == "away" else "@"
+                                )
 
                         # Get venue
                         venue_name = "TBD"
@@ -262,7 +249,7 @@ async def create_optimized_weekly_embed(
                 )
 
         # Add footer
-        embed.set_footer(text="🔄 Updates every Monday at 1pm PT • 🏆 Go LA!")
+        embed.set_footer(text=WEEKLY_EMBED_FOOTER)
 
         return embed
 
@@ -270,7 +257,7 @@ async def create_optimized_weekly_embed(
         logger.error(f"Error creating optimized weekly embed: {e}")
         # Return error embed
         embed = discord.Embed(
-            title="🏆 LA Teams Weekly Schedule",
+            title=WEEKLY_EMBED_TITLE,
             description="❌ Error loading weekly schedule",
             color=0xFF0000,
         )
@@ -284,11 +271,10 @@ async def create_optimized_weekly_embed(
 async def weekly_command(interaction: discord.Interaction):
     """Send the weekly matches notification with optimizations"""
     try:
+        # Acknowledge first so nothing below can miss Discord's 3-second window
+        await interaction.response.defer(ephemeral=True, thinking=True)
         logger.info(f"Weekly command called by {interaction.user}")
 
-        # Send typing indicator
-        await interaction.response.defer(ephemeral=True)
-
         # Get weekly matches data (with caching and parallel processing)
         team_games, metadata = await get_weekly_matches_optimized()
 
@@ -5,11 +5,16 @@ Handles environment variables, logging setup, and bot configuration
 
 import os
 import sys
+import atexit
+import queue
 import logging
 import discord
 import asyncio
+from discord.ext import commands
 from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
+from api.http_client import cleanup_http_client
 
 # Try to import psutil for resource monitoring (optional)
 try:
@@ -49,6 +54,14 @@ if FACTS_CHANNEL_ID:
     except ValueError:
         FACTS_CHANNEL_ID = None
 
+# Get the dev guild ID for instant slash command syncs (optional)
+DEV_GUILD_ID = os.getenv("DEV_GUILD_ID")
+if DEV_GUILD_ID:
+    try:
+        DEV_GUILD_ID = int(DEV_GUILD_ID)
+    except ValueError:
+        DEV_GUILD_ID = None
+
 # Get admin user IDs (optional, comma-separated)
 ADMIN_USER_IDS = os.getenv("ADMIN_USER_IDS", "")
 if ADMIN_USER_IDS:
@@ -69,6 +82,9 @@ MEMORY_LIMIT_MB = int(os.getenv("MEMORY_LIMIT_MB", "512"))  # Default 512MB limi
 CACHE_SIZE_LIMIT = int(os.getenv("CACHE_SIZE_LIMIT", "100"))  # Max cache entries
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Max concurrent interaction followups, keeps bursts under Discord's route limits
+FOLLOWUP_CONCURRENCY = int(os.getenv("FOLLOWUP_CONCURRENCY", "5"))
+
 # Create a new Discord bot with necessary intents
 intents = discord.Intents.default()
 intents.message_content = True
@@ -159,11 +175,20 @@ def setup_logging():
     # Determine log level
     log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    # discord.py's setup covers both the library's loggers and ours (root=True)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    discord.utils.setup_logging(handler=stream_handler, level=log_level, root=True)
+
+    # Write log lines from a background thread so a slow stdout (e.g. Docker's
+    # log driver) never blocks the event loop; loggers only enqueue records
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(stream_handler)
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flushes records still in the queue on shutdown
+    atexit.register(listener.stop)
 
     # Reduce logging from noisy libraries
     logging.getLogger("discord").setLevel(logging.WARNING)
@@ -182,9 +207,54 @@ def setup_logging():
     return logger
 
 
+class GoobieBot(commands.Bot):
+    """Bot that closes the shared aiohttp session when it shuts down"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Set in on_ready and kept current by the guild join/remove events, so
+        # reads don't copy bot.guilds into a new list
+        self.guild_count = 0
+
+    async def on_guild_join(self, guild):
+        """Count a newly joined guild"""
+        self.guild_count += 1
+
+    async def on_guild_remove(self, guild):
+        """Stop counting a guild the bot left or was removed from"""
+        self.guild_count -= 1
+
+    async def setup_hook(self):
+        """Set up per-loop state and sync slash commands once per start"""
+        # Created here so it belongs to the bot's running event loop
+        self.followup_semaphore = asyncio.Semaphore(FOLLOWUP_CONCURRENCY)
+
+        # Synced here rather than in on_ready, which also fires on every reconnect
+        from utils.command_sync import sync_commands_if_changed
+
+        logger = logging.getLogger(__name__)
+        logger.info("🔄 Syncing slash commands...")
+        try:
+            guild = discord.Object(id=DEV_GUILD_ID) if DEV_GUILD_ID else None
+            synced = await sync_commands_if_changed(self, guild)
+            if synced is not None:
+                target = f"guild {DEV_GUILD_ID}" if guild else "all guilds"
+                logger.info(f"✅ Synced {len(synced)} command(s) to {target}")
+                for cmd in synced:
+                    logger.info(f"  - /{cmd.name}: {cmd.description}")
+        except Exception as e:
+            logger.exception(f"❌ Sync failed: {e}")
+
+    async def close(self):
+        """Close the shared HTTP session on the bot's own event loop"""
+        logging.getLogger(__name__).info("🧹 Cleaning up HTTP client...")
+        await cleanup_http_client()
+        await super().close()
+
+
 def create_bot():
     """Create and configure the Discord bot instance"""
-    bot = discord.ext.commands.Bot(command_prefix="!", intents=intents)
+    bot = GoobieBot(command_prefix="!", intents=intents)
 
     # Add Pi-specific attributes if in Pi mode
     if PI_MODE:
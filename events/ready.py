@@ -10,19 +10,9 @@ logger = logging.getLogger(__name__)
 async def on_ready(bot):
     """Event that runs when the bot is ready and connected to Discord"""
     logger.info(f"🚀 {bot.user} has connected to Discord!")
-    logger.info(f"📊 Bot is in {len(bot.guilds)} guilds")
+    bot.guild_count = len(bot.guilds)
+    logger.info(f"📊 Bot is in {bot.guild_count} guilds")
 
-    # Sync slash commands with Discord
-    logger.info("🔄 Syncing slash commands...")
-    try:
-        synced = await bot.tree.sync()
-        logger.info(f"✅ Synced {len(synced)} command(s)")
-        for cmd in synced:
-            logger.info(f"  - /{cmd.name}: {cmd.description}")
-    except Exception as e:
-        logger.error(f"❌ Sync failed: {e}")
-        import traceback
-
-        traceback.print_exc()
+    # Slash commands are synced once in GoobieBot.setup_hook, not per reconnect
 
     logger.info("🎯 Bot ready! Try /ping command.")
@@ -6,8 +6,8 @@ Uses JSON file directly without database complexity
 import discord
 from discord.ext import commands
 import logging
-from datetime import datetime
 
+from utils.permissions import has_admin_permissions
 from .simple_facts import SimpleFacts
 
 logger = logging.getLogger(__name__)
@@ -63,7 +63,7 @@ async def fact_command(interaction: discord.Interaction):
             title=f"{fact_data['emoji']} Goobie Fact",
             description=f"**{fact_data['category']}**\n\n{fact_data['fact']}",
             color=style["color"],
-            timestamp=datetime.now(),
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add thumbnail
@@ -85,62 +85,11 @@ async def fact_command(interaction: discord.Interaction):
         )
 
 
-@discord.app_commands.command(
-    name="factsearch", description="Search for goobie facts by keyword"
-)
-async def fact_search_command(interaction: discord.Interaction, search_term: str):
-    """Slash command to search facts"""
-    try:
-        # Search facts
-        matching_facts = _facts.search_facts(search_term)
-        if not matching_facts:
-            await interaction.response.send_message(
-                f"❌ No facts found matching '{search_term}'",
-                ephemeral=True,
-            )
-            return
-
-        # Limit to 5 results to avoid embed limits
-        display_facts = matching_facts[:5]
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"🔍 Facts matching '{search_term}'",
-            description=f"Found {len(matching_facts)} result{'s' if len(matching_facts) != 1 else ''}",
-            color=0x00923F,
-            timestamp=datetime.now(),
-        )
-
-        # Add facts as fields
-        for i, fact in enumerate(display_facts, 1):
-            embed.add_field(
-                name=f"{i}. {fact['emoji']} {fact['category']}",
-                value=fact["fact"][:200] + "..."
-                if len(fact["fact"]) > 200
-                else fact["fact"],
-                inline=False,
-            )
-
-        if len(matching_facts) > 5:
-            embed.set_footer(text=f"Showing 5 of {len(matching_facts)} results")
-
-        await interaction.response.send_message(embed=embed)
-
-    except Exception as e:
-        logger.error(f"Error in fact search command: {e}")
-        await interaction.response.send_message(
-            "❌ An error occurred while searching facts. Please try again later.",
-            ephemeral=True,
-        )
-
-
 # Text command for fact stats
 @commands.command(name="factstats")
 async def fact_stats_text_command(ctx):
     """Text command to get fact statistics"""
     # Check if user is admin
-    from utils.permissions import has_admin_permissions
-
     if not has_admin_permissions(ctx):
         await ctx.send("❌ You don't have permission to use this command.")
         return
@@ -161,7 +110,7 @@ async def fact_stats_text_command(ctx):
         embed = discord.Embed(
             title="📊 Daily Facts Statistics",
             color=0xFF6B35,  # Orange
-            timestamp=datetime.now(),
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add stats fields
@@ -224,7 +173,7 @@ async def fact_search_text_command(ctx, *, search_term: str):
             title=f"🔍 Facts matching '{search_term}'",
             description=f"Found {len(matching_facts)} result{'s' if len(matching_facts) != 1 else ''}",
             color=0xFF6B35,  # Orange
-            timestamp=datetime.now(),
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add facts as fields
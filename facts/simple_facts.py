@@ -8,6 +8,14 @@ import random
 import logging
 from pathlib import Path
 
+# Try to import orjson for faster facts file parsing (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +35,8 @@ class SimpleFacts:
                 logger.error(f"Facts JSON file not found: {self.json_path}")
                 return
 
-            with open(facts_file, "r") as f:
-                data = json.load(f)
+            raw = facts_file.read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
             self.facts = data.get("facts", [])
             logger.info(f"Loaded {len(self.facts)} facts from JSON")
@@ -14,6 +14,9 @@ from .simple_commands import get_category_style
 
 logger = logging.getLogger(__name__)
 
+# Daily facts are scheduled in Pacific time
+PACIFIC_TZ = pytz.timezone("America/Los_Angeles")
+
 
 class SimpleFactsScheduler:
     """Simple daily facts scheduler using JSON file"""
@@ -28,8 +31,7 @@ class SimpleFactsScheduler:
             logger.info("Sending daily fact post...")
 
             # Check if we already posted today
-            pacific_tz = pytz.timezone("America/Los_Angeles")
-            today = datetime.now(pacific_tz).date()
+            today = datetime.now(PACIFIC_TZ).date()
 
             if self.last_posted_date == today:
                 logger.info("Daily fact already posted today")
@@ -49,7 +51,7 @@ class SimpleFactsScheduler:
                 title=f"📚 Daily Goobie Fact - {today.strftime('%B %d, %Y')}",
                 description=f"**{fact_data['emoji']} {fact_data['category']}**\n\n{fact_data['fact']}",
                 color=style["color"],
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             # Add thumbnail
@@ -78,11 +80,10 @@ class SimpleFactsScheduler:
         try:
             logger.info("Setting up daily facts scheduler...")
 
-            pacific_tz = pytz.timezone("America/Los_Angeles")
 
             while True:
                 # Get current time in Pacific
-                now_pacific = datetime.now(pacific_tz)
+                now_pacific = datetime.now(PACIFIC_TZ)
 
                 # Calculate next 12 PM PT
                 next_12pm = now_pacific.replace(
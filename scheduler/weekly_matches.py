@@ -6,14 +6,74 @@ Handles sending weekly match notifications every Monday at 1pm PT
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import pytz
 import discord
 
-from api.espn.games import get_team_games_in_date_range
+from api.espn.games import get_team_games_in_date_range, parse_espn_date
 from api.espn.teams import get_team_name_from_ref
 
 logger = logging.getLogger(__name__)
 
+# Weekly schedules are built and sent in Pacific time
+PACIFIC_TZ = pytz.timezone("America/Los_Angeles")
+
+# Static parts of the weekly schedule embed, shared with the /weekly command
+WEEKLY_EMBED_TITLE = "🏆 LA Teams Weekly Schedule"
+WEEKLY_EMBED_COLOR = 0x00923F  # LA City green
+WEEKLY_EMBED_THUMBNAIL = "https://raw.githubusercontent.com/kay-rey/goobie-bot/main/assets/goobies/goobieheadclear.png"
+WEEKLY_EMBED_FOOTER = "🔄 Updates every Monday at 1pm PT • 🏆 Go LA!"
+
+# Per-game date and time formats for weekly schedule embeds
+WEEKLY_DATE_FORMAT = "%a, %b %d"
+WEEKLY_TIME_FORMAT = "%I:%M %p PT"
+
+# ESPN team IDs for our LA teams, keyed by the lowercase name used in embed headers
+LA_TEAM_IDS = MappingProxyType(
+    {
+        "dodgers": "19",
+        "lakers": "13",
+        "galaxy": "187",  # LA Galaxy's actual ESPN team ID
+        "rams": "14",  # Los Angeles Rams ESPN team ID
+    }
+)
+
+
+def get_la_team_id(team_name):
+    """Get the ESPN team ID for an embed team header like "⚽ LA Galaxy" """
+    team_name = team_name.lower()
+    return next(
+        (team_id for team_key, team_id in LA_TEAM_IDS.items() if team_key in team_name),
+        None,
+    )
+
+
+def find_opponent(competitors, current_team_id):
+    """Return the first competitor that isn't our LA team, or None"""
+    return next((c for c in competitors if c.get("id", "") != current_team_id), None)
+
+
+async def prefetch_opponent_names(teams_data, games_per_team=5):
+    """
+    Resolve every shown opponent's name concurrently
+
+    Names land in the team name cache, so the per-game lookups while
+    building the embed are cache hits instead of one request at a time.
+    """
+    team_refs = set()
+    for team_name, games in teams_data:
+        current_team_id = get_la_team_id(team_name)
+        for game in games[:games_per_team]:
+            for competition in game.get("competitions", [])[:1]:
+                opponent = find_opponent(
+                    competition.get("competitors", []), current_team_id
+                )
+                team_ref = opponent and opponent.get("team", {}).get("$ref")
+                if team_ref:
+                    team_refs.add(team_ref)
+
+    await asyncio.gather(*(get_team_name_from_ref(ref) for ref in team_refs))
+
 
 async def get_weekly_matches_for_team(team_name, team_id, sport, league):
     """Get all matches for a team in the current week (Monday to Sunday)"""
@@ -21,8 +81,7 @@ async def get_weekly_matches_for_team(team_name, team_id, sport, league):
         logger.info(f"Getting weekly matches for {team_name}")
 
         # Get current date and calculate week boundaries
-        pacific_tz = pytz.timezone("America/Los_Angeles")
-        now_pacific = datetime.now(pacific_tz)
+        now_pacific = datetime.now(PACIFIC_TZ)
 
         # Find the most recent Monday (start of week)
         days_since_monday = now_pacific.weekday()  # Monday is 0
@@ -44,15 +103,15 @@ async def get_weekly_matches_for_team(team_name, team_id, sport, league):
         for game in games:
             if game.get("date"):
                 try:
-                    game_date = datetime.fromisoformat(
-                        game["date"].replace("Z", "+00:00")
-                    )
-                    game_date_pacific = game_date.astimezone(pacific_tz)
+                    game_date = parse_espn_date(game["date"])
+                    game_date_pacific = game_date.astimezone(PACIFIC_TZ)
 
                     # Check if game is within our week
                     if week_start <= game_date_pacific <= week_end:
                         filtered_games.append(game)
-                        logger.debug(f"Added {team_name} game on {game_date_pacific}")
+                        logger.debug(
+                            "Added %s game on %s", team_name, game_date_pacific
+                        )
                 except Exception as e:
                     logger.warning(f"Error parsing game date for {team_name}: {e}")
 
@@ -69,38 +128,31 @@ async def create_weekly_matches_embed():
     try:
         logger.info("Creating weekly matches embed...")
 
-        # Get weekly matches for each team
+        # Get weekly matches for each team concurrently
         # Team IDs: Dodgers (19), Lakers (13), Galaxy (187), Rams (14)
-        dodgers_games = await get_weekly_matches_for_team(
-            "Dodgers", 19, "baseball", "mlb"
-        )
-        lakers_games = await get_weekly_matches_for_team(
-            "Lakers", 13, "basketball", "nba"
-        )
-        galaxy_games = await get_weekly_matches_for_team(
-            "Galaxy", 187, "soccer", "usa.1"
+        dodgers_games, lakers_games, galaxy_games, rams_games = await asyncio.gather(
+            get_weekly_matches_for_team("Dodgers", 19, "baseball", "mlb"),
+            get_weekly_matches_for_team("Lakers", 13, "basketball", "nba"),
+            get_weekly_matches_for_team("Galaxy", 187, "soccer", "usa.1"),
+            get_weekly_matches_for_team("Rams", 14, "football", "nfl"),
         )
-        rams_games = await get_weekly_matches_for_team("Rams", 14, "football", "nfl")
 
         # Calculate week boundaries for display
-        pacific_tz = pytz.timezone("America/Los_Angeles")
-        now_pacific = datetime.now(pacific_tz)
+        now_pacific = datetime.now(PACIFIC_TZ)
         days_since_monday = now_pacific.weekday()
         week_start = now_pacific - timedelta(days=days_since_monday)
         week_end = week_start + timedelta(days=6)
 
         # Create main embed with better formatting
         embed = discord.Embed(
-            title="🏆 LA Teams Weekly Schedule",
+            title=WEEKLY_EMBED_TITLE,
             description=f"**📅 Week of {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}**\n\n",
-            color=0x00923F,  # LA City green
-            timestamp=datetime.now(),
+            color=WEEKLY_EMBED_COLOR,
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add a thumbnail or image if available
-        embed.set_thumbnail(
-            url="https://raw.githubusercontent.com/kay-rey/goobie-bot/main/assets/goobies/goobieheadclear.png"
-        )
+        embed.set_thumbnail(url=WEEKLY_EMBED_THUMBNAIL)
 
         # Calculate total games for summary
         total_games = (
@@ -126,22 +178,26 @@ async def create_weekly_matches_embed():
             ("🏀 Los Angeles Lakers", lakers_games),
             ("🏈 Los Angeles Rams", rams_games),
         ]
+        await prefetch_opponent_names(teams_data)
 
         for team_name, games in teams_data:
             if games:
                 # Create detailed game information for each team
                 game_details = []
+                current_team_id = get_la_team_id(team_name)
 
                 for i, game in enumerate(games[:5]):  # Show up to 5 games per team
                     try:
                         # Parse game date
                         if game.get("date"):
-                            game_date = datetime.fromisoformat(
-                                game["date"].replace("Z", "+00:00")
+                            game_date = parse_espn_date(game["date"])
+                            game_date_pacific = game_date.astimezone(PACIFIC_TZ)
+                            formatted_date = game_date_pacific.strftime(
+                                WEEKLY_DATE_FORMAT
+                            )
+                            formatted_time = game_date_pacific.strftime(
+                                WEEKLY_TIME_FORMAT
                             )
-                            game_date_pacific = game_date.astimezone(pacific_tz)
-                            formatted_date = game_date_pacific.strftime("%a, %b %d")
-                            formatted_time = game_date_pacific.strftime("%I:%M %p PT")
                         else:
                             formatted_date = "TBD"
                             formatted_time = "TBD"
@@ -154,59 +210,37 @@ async def create_weekly_matches_embed():
                             competition = competitions[0]
                             competitors = competition.get("competitors", [])
 
-                            # Define our LA team IDs
-                            la_team_ids = {
-                                "dodgers": "19",
-                                "lakers": "13",
-                                "galaxy": "187",  # LA Galaxy's actual ESPN team ID
-                                "rams": "14",  # Los Angeles Rams ESPN team ID
-                            }
-
-                            # Get the current team ID based on team name
-                            current_team_id = None
-                            for team_key, team_id in la_team_ids.items():
-                                if team_key in team_name.lower():
-                                    current_team_id = team_id
-                                    break
-
                             logger.debug(
-                                f"Processing game for {team_name} (ID: {current_team_id}): {len(competitors)} competitors"
+                                "Processing game for %s (ID: %s): %d competitors",
+                                team_name,
+                                current_team_id,
+                                len(competitors),
                             )
 
+                            # The opponent is the first team that isn't our LA team
+                            competitor = None
                             if len(competitors) >= 2 and current_team_id:
-                                # Find which team is the opponent (not our LA team)
-                                for competitor in competitors:
-                                    competitor_id = competitor.get("id", "")
-                                    competitor_home_away = competitor.get(
-                                        "homeAway", ""
-                                    )
-
-                                    logger.debug(
-                                        f"Competitor ID: {competitor_id} ({competitor_home_away})"
-                                    )
-
-                                    # If this is NOT our LA team, it's the opponent
-                                    if competitor_id != current_team_id:
-                                        # Get opponent name from team reference URL
-                                        team_ref = competitor.get("team", {}).get(
-                                            "$ref", ""
-                                        )
-                                        opponent_name = await get_team_name_from_ref(
-                                            team_ref
-                                        )
-                                        opponent = opponent_name
-
-                                        # Determine if LA team is home or away
-                                        home_away = (
-                                            "vs"
-                                            if competitor_home_away == "away"
-                                            else "@"
-                                        )
-
-                                        logger.debug(
-                                            f"Found opponent: {opponent} (ID: {competitor_id}, {competitor_home_away}) -> LA team is {home_away}"
-                                        )
-                                        break
+                                competitor = find_opponent(competitors, current_team_id)
+
+                            if competitor:
+                                competitor_home_away = competitor.get("homeAway", "")
+
+                                # Get opponent name from team reference URL
+                                team_ref = competitor.get("team", {}).get("$ref", "")
+                                opponent = await get_team_name_from_ref(team_ref)
+
+                                # Determine if LA team is home or away
+                                home_away = (
+                                    "vs" if competitor_home_away == "away" else "@"
+                                )
+
+                                logger.debug(
+                                    "Found opponent: %s (ID: %s, %s) -> LA team is %s",
+                                    opponent,
+                                    competitor.get("id", ""),
+                                    competitor_home_away,
+                                    home_away,
+                                )
 
                         # Get venue
                         venue_name = "TBD"
@@ -259,7 +293,7 @@ async def create_weekly_matches_embed():
                 )
 
         # Add footer with better formatting
-        embed.set_footer(text="🔄 Updates every Monday at 1pm PT • 🏆 Go LA!")
+        embed.set_footer(text=WEEKLY_EMBED_FOOTER)
 
         return embed
 
@@ -267,7 +301,7 @@ async def create_weekly_matches_embed():
         logger.error(f"Error creating weekly matches embed: {e}")
         # Return a basic error embed
         embed = discord.Embed(
-            title="🏆 LA Teams Weekly Schedule",
+            title=WEEKLY_EMBED_TITLE,
             description="Error loading weekly schedule",
             color=0xFF0000,
         )
@@ -314,11 +348,10 @@ async def schedule_weekly_matches(bot, channel_id=None):
     try:
         logger.info("Setting up weekly matches scheduler...")
 
-        pacific_tz = pytz.timezone("America/Los_Angeles")
 
         while True:
             # Get current time in Pacific
-            now_pacific = datetime.now(pacific_tz)
+            now_pacific = datetime.now(PACIFIC_TZ)
 
             # Calculate next Monday at 1pm PT
             days_until_monday = (7 - now_pacific.weekday()) % 7
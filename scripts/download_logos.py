@@ -5,10 +5,15 @@ Downloads all team logos and stores them locally in the container
 """
 
 import asyncio
-import aiohttp
 import logging
+import sys
 from pathlib import Path
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.http_client import cleanup_http_client, http_client
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -64,7 +69,8 @@ async def download_image(session, url, filepath):
             logger.warning("Empty URL provided, skipping download")
             return False
 
-        async with session.get(url) as response:
+        # The shared session asks for JSON by default
+        async with session.get(url, headers={"Accept": "image/*"}) as response:
             if response.status == 200:
                 content = await response.read()
                 # Ensure directory exists
@@ -93,8 +99,11 @@ async def download_team_logos():
 
     assets_dir.mkdir(parents=True, exist_ok=True)
 
-    async with aiohttp.ClientSession() as session:
-        # Download main team logos
+    # Reuse the bot's pooled session so downloads share warm keep-alive connections
+    session = await http_client.get_session()
+    try:
+        # Collect main team logos, then download them all concurrently
+        downloads = []
         for team_key, team_data in TEAM_LOGOS.items():
             logger.info(f"Downloading logos for {team_data['team_name']}")
             team_dir = assets_dir / team_key
@@ -111,7 +120,12 @@ async def download_team_logos():
                     url = team_data[logo_type]
                     filename = f"{logo_type}.png"
                     filepath = team_dir / filename
-                    await download_image(session, url, filepath)
+                    downloads.append(download_image(session, url, filepath))
+
+        results = await asyncio.gather(*downloads)
+        logger.info(f"Downloaded {sum(results)} of {len(results)} logos")
+    finally:
+        await cleanup_http_client()
 
 
 def create_logo_manifest():
@@ -6,13 +6,18 @@ This script tests the TheSportsDB and ESPN APIs to understand their responses
 and help debug logo and data issues.
 """
 
-import requests
-import json
 import asyncio
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def test_thesportsdb_search():
+from api.http_client import HEAD_TIMEOUT, cleanup_http_client, http_client, loads_json
+
+
+async def _test_thesportsdb_search(session):
     """Test TheSportsDB team search API"""
     print("🔍 Testing TheSportsDB Team Search API")
     print("=" * 50)
@@ -21,12 +26,13 @@ def test_thesportsdb_search():
     params = {"t": "LA Galaxy"}
 
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"Status Code: {response.status_code}")
-        print(f"Headers: {dict(response.headers)}")
+        async with session.get(url, params=params) as response:
+            print(f"Status Code: {response.status}")
+            print(f"Headers: {dict(response.headers)}")
+            body = await response.read()
 
-        if response.status_code == 200:
-            data = response.json()
+        if response.status == 200:
+            data = loads_json(body)
             print(f"Response Keys: {list(data.keys())}")
 
             if data.get("teams"):
@@ -50,7 +56,7 @@ def test_thesportsdb_search():
             else:
                 print("❌ No teams found in response")
         else:
-            print(f"❌ API Error: {response.text}")
+            print(f"❌ API Error: {body.decode(errors='replace')}")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -58,7 +64,7 @@ def test_thesportsdb_search():
     return None
 
 
-def test_thesportsdb_lookup(team_id):
+async def _test_thesportsdb_lookup(session, team_id):
     """Test TheSportsDB team lookup API"""
     print(f"\n🔍 Testing TheSportsDB Team Lookup API for ID: {team_id}")
     print("=" * 50)
@@ -66,11 +72,12 @@ def test_thesportsdb_lookup(team_id):
     url = f"https://www.thesportsdb.com/api/v1/json/123/lookupteam.php?id={team_id}"
 
     try:
-        response = requests.get(url, timeout=10)
-        print(f"Status Code: {response.status_code}")
+        async with session.get(url) as response:
+            print(f"Status Code: {response.status}")
+            body = await response.read()
 
-        if response.status_code == 200:
-            data = response.json()
+        if response.status == 200:
+            data = loads_json(body)
             print(f"Response Keys: {list(data.keys())}")
 
             if data.get("teams") and len(data["teams"]) > 0:
@@ -84,13 +91,13 @@ def test_thesportsdb_lookup(team_id):
                 print(f"Stadium Thumb: {team.get('strStadiumThumb')}")
 
                 # Test logo URLs
-                test_logo_urls(team)
+                await _test_logo_urls(session, team)
 
                 return team
             else:
                 print("❌ No team data found")
         else:
-            print(f"❌ API Error: {response.text}")
+            print(f"❌ API Error: {body.decode(errors='replace')}")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -98,7 +105,7 @@ def test_thesportsdb_lookup(team_id):
     return None
 
 
-def test_logo_urls(team):
+async def _test_logo_urls(session, team):
     """Test logo URL validity and different sizes"""
     print(f"\n🖼️ Testing Logo URLs")
     print("=" * 50)
@@ -111,29 +118,32 @@ def test_logo_urls(team):
             print(f"\n--- {field} ---")
             print(f"Original URL: {url}")
 
-            # Test original URL
-            test_url_status(url, "Original")
-
-            # Test different sizes
-            for size in ["/small", "/medium", "/tiny"]:
-                sized_url = url + size
-                test_url_status(sized_url, f"Size {size}")
+            # Test the original URL and the different sizes concurrently
+            checks = [(url, "Original")] + [
+                (url + size, f"Size {size}") for size in ["/small", "/medium", "/tiny"]
+            ]
+            results = await asyncio.gather(
+                *(_url_status(session, check_url) for check_url, _ in checks)
+            )
+            for (check_url, label), result in zip(checks, results):
+                print(f"{result[0]} {label}: {result[1]} - {check_url}")
         else:
             print(f"\n--- {field} ---")
             print("❌ No URL provided")
 
 
-def test_url_status(url, label):
-    """Test if a URL is accessible"""
+async def _url_status(session, url):
+    """Check if a URL is accessible, returning (status icon, status or error)"""
     try:
-        response = requests.head(url, timeout=5)
-        status = "✅" if response.status_code == 200 else "❌"
-        print(f"{status} {label}: {response.status_code} - {url}")
+        async with session.head(
+            url, timeout=HEAD_TIMEOUT, allow_redirects=True
+        ) as response:
+            return ("✅" if response.status == 200 else "❌"), response.status
     except Exception as e:
-        print(f"❌ {label}: Error - {e}")
+        return "❌", f"Error - {e}"
 
 
-def test_espn_api():
+async def _test_espn_api(session):
     """Test ESPN API for LA Galaxy games"""
     print(f"\n🏈 Testing ESPN API for LA Galaxy")
     print("=" * 50)
@@ -147,12 +157,13 @@ def test_espn_api():
     params = {"limit": 5, "dates": f"{start_date}-{end_date}"}
 
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"Status Code: {response.status_code}")
+        async with session.get(url, params=params) as response:
+            print(f"Status Code: {response.status}")
+            body = await response.read()
         print(f"Date Range: {start_date} to {end_date}")
 
-        if response.status_code == 200:
-            data = response.json()
+        if response.status == 200:
+            data = loads_json(body)
             print(f"Response Keys: {list(data.keys())}")
 
             if data.get("items"):
@@ -165,26 +176,27 @@ def test_espn_api():
                     # Fetch event details
                     event_ref = item.get("$ref")
                     if event_ref:
-                        test_espn_event_details(event_ref, i + 1)
+                        await _test_espn_event_details(session, event_ref, i + 1)
             else:
                 print("❌ No events found")
         else:
-            print(f"❌ API Error: {response.text}")
+            print(f"❌ API Error: {body.decode(errors='replace')}")
 
     except Exception as e:
         print(f"❌ Error: {e}")
 
 
-def test_espn_event_details(event_ref, event_num):
+async def _test_espn_event_details(session, event_ref, event_num):
     """Test ESPN event details API"""
     print(f"\n--- Event {event_num} Details ---")
 
     try:
-        response = requests.get(event_ref, timeout=10)
-        print(f"Status Code: {response.status_code}")
+        async with session.get(event_ref) as response:
+            print(f"Status Code: {response.status}")
+            body = await response.read()
 
-        if response.status_code == 200:
-            event_data = response.json()
+        if response.status == 200:
+            event_data = loads_json(body)
             print(f"Event Keys: {list(event_data.keys())}")
 
             # Extract key information
@@ -199,7 +211,7 @@ def test_espn_event_details(event_ref, event_num):
                     event_date = datetime.fromisoformat(
                         event_date_str.replace("Z", "+00:00")
                     )
-                    now = datetime.now()
+                    now = datetime.now(timezone.utc)
                     is_future = event_date > now
                     print(
                         f"Is Future: {is_future} ({event_date.strftime('%Y-%m-%d %H:%M')})"
@@ -226,55 +238,71 @@ def test_espn_event_details(event_ref, event_num):
                     team_ref = competitor.get("team", {}).get("$ref")
                     if team_ref:
                         print(f"Team Ref: {team_ref}")
-                        test_espn_team_details(team_ref, i + 1)
+                        await _test_espn_team_details(session, team_ref, i + 1)
         else:
-            print(f"❌ Event API Error: {response.text}")
+            print(f"❌ Event API Error: {body.decode(errors='replace')}")
 
     except Exception as e:
         print(f"❌ Event Error: {e}")
 
 
-def test_espn_team_details(team_ref, team_num):
+async def _test_espn_team_details(session, team_ref, team_num):
     """Test ESPN team details API"""
     print(f"\n--- Team {team_num} Details ---")
 
     try:
-        response = requests.get(team_ref, timeout=10)
-        print(f"Status Code: {response.status_code}")
+        async with session.get(team_ref) as response:
+            print(f"Status Code: {response.status}")
+            body = await response.read()
 
-        if response.status_code == 200:
-            team_data = response.json()
+        if response.status == 200:
+            team_data = loads_json(body)
             print(f"Team Keys: {list(team_data.keys())}")
             print(f"Team ID: {team_data.get('id')}")
             print(f"Team Name: {team_data.get('displayName')}")
             print(f"Team Short Name: {team_data.get('shortDisplayName')}")
             print(f"Team Abbreviation: {team_data.get('abbreviation')}")
         else:
-            print(f"❌ Team API Error: {response.text}")
+            print(f"❌ Team API Error: {body.decode(errors='replace')}")
 
     except Exception as e:
         print(f"❌ Team Error: {e}")
 
 
-def main():
-    """Run all API tests"""
+async def _test_apis():
+    """Run all API tests through the bot's shared HTTP session"""
     print("🤖 Goobie-Bot API Testing Suite")
     print("=" * 60)
 
-    # Test TheSportsDB search
-    la_galaxy_team = test_thesportsdb_search()
+    try:
+        session = await http_client.get_session()
+
+        # Test TheSportsDB search
+        la_galaxy_team = await _test_thesportsdb_search(session)
 
-    if la_galaxy_team:
-        team_id = la_galaxy_team.get("idTeam")
-        if team_id:
-            # Test TheSportsDB lookup
-            test_thesportsdb_lookup(team_id)
+        if la_galaxy_team:
+            team_id = la_galaxy_team.get("idTeam")
+            if team_id:
+                # Test TheSportsDB lookup
+                await _test_thesportsdb_lookup(session, team_id)
 
-    # Test ESPN API
-    test_espn_api()
+        # Test ESPN API
+        await _test_espn_api(session)
+    finally:
+        await cleanup_http_client()
 
     print("\n✅ API Testing Complete!")
 
 
+def test_apis():
+    """Run all API tests"""
+    asyncio.run(_test_apis())
+
+
+def main():
+    """Run all API tests"""
+    test_apis()
+
+
 if __name__ == "__main__":
     main()
@@ -12,16 +12,26 @@ This script tests the caching functionality including:
 
 import asyncio
 import logging
+import os
 import sys
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Keep test entries out of the bot's persistent cache (api/data/cache.db)
+_cache_dir = tempfile.TemporaryDirectory()
+os.environ["CACHE_DB_PATH"] = str(Path(_cache_dir.name) / "cache.db")
+
+import api.cache  # noqa: E402
 from api.cache import (  # noqa: E402
+    PersistentCache,
+    cache_manager,
     get_cached,
     set_cached,
     delete_cached,
@@ -242,6 +252,67 @@ class CacheTestSuite:
             f"Short TTL: {cached_value_1}, Long TTL: {cached_value_2}",
         )
 
+    async def test_persistent_cache(self):
+        """Test the SQLite persistent cache layer"""
+        print("\n💾 Testing Persistent Cache")
+        print("=" * 50)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            persistent = PersistentCache(str(Path(tmp_dir) / "cache.db"))
+
+            # Test 1: Round-trip a persisted cache type
+            venue_key = venue_data_key("Dignity Health Sports Park")
+            venue_value = {"name": "Dignity Health Sports Park", "capacity": 27000}
+            await persistent.set_many({venue_key: venue_value}, "venue_data")
+            stored = await persistent.get(venue_key)
+
+            self.log_test_result(
+                "Persistent Round-trip",
+                stored == (venue_value, "venue_data"),
+                f"Expected: {(venue_value, 'venue_data')}, Got: {stored}",
+            )
+
+            # Test 2: In-memory cache types are not written to disk
+            game_key = game_data_key("galaxy", "soccer", "20250101", "20250201")
+            await persistent.set_many({game_key: {"id": "1"}}, "game_data")
+            stored = await persistent.get(game_key)
+
+            self.log_test_result(
+                "Non-persisted Type Skipped",
+                stored is None,
+                f"Expected: None, Got: {stored}",
+            )
+
+            # Test 3: Expired entries are not returned
+            logo_key = team_logos_key("134153")
+            await persistent.set_many({logo_key: {"logo": "x.png"}}, "team_logos")
+            with patch("api.cache.time.time", return_value=time.time() + 8 * 86400):
+                cleaned_count = await persistent.cleanup_expired()
+                stored = await persistent.get(logo_key)
+
+            self.log_test_result(
+                "Persistent Expiry",
+                stored is None and cleaned_count == 1,
+                f"Value: {stored}, Cleaned: {cleaned_count}",
+            )
+
+            # Test 4: get_cached promotes disk hits into the in-memory cache
+            original_persistent = api.cache.persistent_cache
+            api.cache.persistent_cache = persistent
+            try:
+                await clear_cache()
+                await persistent.set_many({venue_key: venue_value}, "venue_data")
+                promoted_value = await get_cached(venue_key)
+                memory_value = await cache_manager.get(venue_key)
+            finally:
+                api.cache.persistent_cache = original_persistent
+
+            self.log_test_result(
+                "Persistent Promotion",
+                promoted_value == venue_value and memory_value == venue_value,
+                f"Returned: {promoted_value}, In memory: {memory_value}",
+            )
+
     async def test_cache_key_generators(self):
         """Test cache key generation functions"""
         print("\n🔑 Testing Cache Key Generators")
@@ -514,6 +585,7 @@ class CacheTestSuite:
             await self.test_basic_cache_operations()
             await self.test_cache_statistics()
             await self.test_cache_ttl_expiration()
+            await self.test_persistent_cache()
             await self.test_cache_key_generators()
             await self.test_cache_clear_operations()
             await self.test_cache_concurrency()
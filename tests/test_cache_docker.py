@@ -9,6 +9,7 @@ It doesn't require Discord bot initialization and focuses on core cache function
 import asyncio
 import logging
 import sys
+import tempfile
 import time
 import os
 from pathlib import Path
@@ -17,6 +18,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Keep test entries out of the bot's persistent cache (api/data/cache.db)
+_cache_dir = tempfile.TemporaryDirectory()
+os.environ["CACHE_DB_PATH"] = str(Path(_cache_dir.name) / "cache.db")
+
 # Set up logging for Docker environment
 logging.basicConfig(
     level=logging.INFO,
@@ -7,7 +7,9 @@ This script tests cache performance and provides real-world usage scenarios.
 
 import asyncio
 import logging
+import os
 import sys
+import tempfile
 import time
 from pathlib import Path
 
@@ -15,7 +17,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.cache import (
+# Keep test entries out of the bot's persistent cache (api/data/cache.db)
+_cache_dir = tempfile.TemporaryDirectory()
+os.environ["CACHE_DB_PATH"] = str(Path(_cache_dir.name) / "cache.db")
+
+from api.cache import (  # noqa: E402
     get_cached,
     set_cached,
     clear_cache,
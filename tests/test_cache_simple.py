@@ -7,7 +7,9 @@ This script tests basic cache functionality without requiring the full bot envir
 
 import asyncio
 import logging
+import os
 import sys
+import tempfile
 import time
 from pathlib import Path
 
@@ -15,6 +17,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Keep test entries out of the bot's persistent cache (api/data/cache.db)
+_cache_dir = tempfile.TemporaryDirectory()
+os.environ["CACHE_DB_PATH"] = str(Path(_cache_dir.name) / "cache.db")
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
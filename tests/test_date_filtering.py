@@ -3,11 +3,18 @@
 Test script to verify date filtering is working correctly
 """
 
-import requests
+import asyncio
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def test_date_filtering():
+from api.http_client import cleanup_http_client, get_json
+
+
+async def _test_date_filtering():
     """Test the date filtering logic"""
     print("🗓️ Testing Date Filtering Logic")
     print("=" * 50)
@@ -29,11 +36,11 @@ def test_date_filtering():
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"API Response Status: {response.status_code}")
+        # Use the bot's shared HTTP client so the test covers the same request path
+        data = await get_json(url, params=params)
+        print(f"API Response Status: {200 if data else 'Failed'}")
 
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             print(f"Number of events found: {len(data.get('items', []))}")
 
             if data.get("items"):
@@ -41,9 +48,8 @@ def test_date_filtering():
                 for i, item in enumerate(data["items"]):
                     event_ref = item.get("$ref")
                     if event_ref:
-                        event_response = requests.get(event_ref, timeout=10)
-                        if event_response.status_code == 200:
-                            event_data = event_response.json()
+                        event_data = await get_json(event_ref)
+                        if event_data:
                             event_date_str = event_data.get("date", "")
 
                             if event_date_str:
@@ -73,10 +79,17 @@ def test_date_filtering():
                 print("No events found in 2-week window")
                 print("This might be correct if there are no upcoming games soon")
         else:
-            print(f"API Error: {response.text}")
+            print("API Error: no data returned")
 
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        await cleanup_http_client()
+
+
+def test_date_filtering():
+    """Run the date filtering test on a fresh event loop"""
+    asyncio.run(_test_date_filtering())
 
 
 if __name__ == "__main__":
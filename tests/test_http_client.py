@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared HTTP client's retry and backoff handling
+
+Uses a stubbed aiohttp session, so no network access is needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.http_client import MAX_ATTEMPTS, HTTPClient  # noqa: E402
+
+
+class StubResponse:
+    """Minimal stand-in for aiohttp.ClientResponse"""
+
+    def __init__(self, status: int, body: bytes = b"{}", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class StubSession:
+    """Session that replays canned responses and counts requests"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = 0
+        self.closed = False
+
+    def get(self, url, params=None, **kwargs):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+def _client_with(responses):
+    """Create an HTTP client whose session returns the given responses"""
+    client = HTTPClient()
+    client._session = StubSession(responses)
+    return client
+
+
+async def _no_sleep(delay):
+    """Skip backoff waits so the tests run instantly"""
+    _no_sleep.delays.append(delay)
+
+
+async def _test_retries_server_errors():
+    """A 5xx response is retried and the later success is returned"""
+    print("🔁 Testing retry on server errors")
+    client = _client_with([StubResponse(503), StubResponse(200, b'{"ok": true}')])
+
+    data = await client.get("https://example.com/api")
+
+    assert data == {"ok": True}, f"Expected data after retry, got {data}"
+    assert client._session.requests == 2
+    print("✅ Retried 503 and returned the next response")
+
+
+async def _test_honors_retry_after():
+    """A 429 waits at least the Retry-After delay before retrying"""
+    print("⏳ Testing Retry-After on 429")
+    client = _client_with(
+        [StubResponse(429, headers={"Retry-After": "7"}), StubResponse(200)]
+    )
+
+    data = await client.get("https://example.com/api")
+
+    assert data == {}, f"Expected data after retry, got {data}"
+    assert _no_sleep.delays and min(_no_sleep.delays) >= 7, _no_sleep.delays
+    assert "example.com" in client._blocked_until
+    print(f"✅ Waited {_no_sleep.delays[0]:.2f}s before retrying")
+
+
+async def _test_gives_up_after_last_attempt():
+    """Persistent failures stop after MAX_ATTEMPTS and return None"""
+    print("🛑 Testing give-up after the last attempt")
+    client = _client_with([StubResponse(500) for _ in range(MAX_ATTEMPTS)])
+
+    data = await client.get("https://example.com/api")
+
+    assert data is None, f"Expected None, got {data}"
+    assert client._session.requests == MAX_ATTEMPTS
+    print(f"✅ Gave up after {MAX_ATTEMPTS} attempts")
+
+
+async def _test_does_not_retry_client_errors():
+    """A 4xx other than 429 is not retried"""
+    print("🚫 Testing no retry on 404")
+    client = _client_with([StubResponse(404)])
+
+    data = await client.get("https://example.com/api")
+
+    assert data is None
+    assert client._session.requests == 1
+    print("✅ 404 returned None without retrying")
+
+
+async def _test_rate_limiter_per_attempt():
+    """A rate limiter passed to get() is acquired once per attempt"""
+    print("🎟️ Testing rate limiter acquisition per attempt")
+
+    class CountingLimiter:
+        acquired = 0
+
+        async def acquire(self):
+            self.acquired += 1
+
+    limiter = CountingLimiter()
+    client = _client_with([StubResponse(429), StubResponse(502), StubResponse(200)])
+
+    await client.get("https://example.com/api", rate_limiter=limiter)
+
+    assert limiter.acquired == 3, f"Expected 3 acquisitions, got {limiter.acquired}"
+    print("✅ Every attempt took a rate limit slot")
+
+
+async def _test_reports_attempts():
+    """on_response receives the status of every attempt"""
+    print("📋 Testing per-attempt reporting")
+    attempts = []
+    client = _client_with([StubResponse(503), StubResponse(200)])
+
+    await client.get(
+        "https://example.com/api",
+        on_response=lambda status, latency: attempts.append((status, latency)),
+    )
+
+    assert [status for status, _ in attempts] == [503, 200], attempts
+    assert all(latency < 1 for _, latency in attempts), attempts
+    print("✅ Reported both attempts without backoff time")
+
+
+async def _test_http_client():
+    """Run all HTTP client tests"""
+    print("🌐 Goobie-Bot HTTP Client Testing Suite")
+    print("=" * 50)
+
+    for test in (
+        _test_retries_server_errors,
+        _test_honors_retry_after,
+        _test_gives_up_after_last_attempt,
+        _test_does_not_retry_client_errors,
+        _test_rate_limiter_per_attempt,
+        _test_reports_attempts,
+    ):
+        _no_sleep.delays = []
+        with patch("api.http_client.asyncio.sleep", _no_sleep):
+            await test()
+
+
+def test_http_client():
+    """Run the HTTP client tests on a fresh event loop"""
+    asyncio.run(_test_http_client())
+
+
+if __name__ == "__main__":
+    test_http_client()
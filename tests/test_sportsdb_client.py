@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for TheSportsDB client's rate and concurrency limiters
+
+Runs offline, no API requests are made.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.sportsdb.client import (  # noqa: E402
+    AIMDConcurrencyLimiter,
+    RateLimiter,
+    get_sportsdb_json,
+)
+
+# Created at import time like the module-level limiters, before any event loop
+# exists, so the tests catch primitives bound to the wrong loop (Python 3.9)
+concurrency_limiter = AIMDConcurrencyLimiter(2, 8, target_latency=1.0)
+rate_limiter = RateLimiter(max_rate=10, period=60)
+request_limiter = AIMDConcurrencyLimiter(2, 8, target_latency=0.1)
+
+
+async def _test_contended_concurrency():
+    """More concurrent acquires than the starting limit all complete in bounds"""
+    print("🚦 Testing contended concurrency limiter")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def worker():
+        nonlocal in_flight, max_in_flight
+        await concurrency_limiter.acquire()
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        # Slow responses keep the limit at its minimum
+        await concurrency_limiter.release(latency=5.0, success=False)
+
+    await asyncio.wait_for(asyncio.gather(*(worker() for _ in range(6))), timeout=5)
+
+    assert max_in_flight <= 2, f"Expected at most 2 in flight, got {max_in_flight}"
+    assert concurrency_limiter.limit == 2
+    print(f"✅ 6 acquires completed with at most {max_in_flight} in flight")
+
+
+async def _test_concurrency_grows_on_success():
+    """Fast successful requests raise the limit up to max_limit"""
+    print("📈 Testing additive increase")
+    for _ in range(20):
+        await concurrency_limiter.acquire()
+        await concurrency_limiter.release(latency=0.1, success=True)
+
+    assert concurrency_limiter.limit == 8, concurrency_limiter.limit
+    print(f"✅ Limit grew to {concurrency_limiter.limit}")
+
+
+async def _test_contended_rate_limiter():
+    """Concurrent acquires within the budget all get a slot"""
+    print("⏱️ Testing contended rate limiter")
+    await asyncio.wait_for(
+        asyncio.gather(*(rate_limiter.acquire() for _ in range(10))), timeout=5
+    )
+
+    assert len(rate_limiter._timestamps) == 10
+    print("✅ 10 concurrent acquires took 10 slots")
+
+
+async def _test_quota_wait_not_latency():
+    """Waiting for a rate limit slot doesn't count as a slow response"""
+    print("⌛ Testing AIMD latency excludes rate limit waits")
+
+    async def fake_get_json(url, params=None, rate_limiter=None, on_response=None):
+        # A long quota wait followed by a fast response
+        await asyncio.sleep(0.2)
+        on_response(200, 0.01)
+        return {"teams": []}
+
+    with patch("api.sportsdb.client.get_json", fake_get_json), patch(
+        "api.sportsdb.client.sportsdb_concurrency", request_limiter
+    ):
+        for _ in range(2):
+            await get_sportsdb_json("searchteams.php", params={"t": "LA Galaxy"})
+
+    assert request_limiter.limit == 3, f"Expected 3, got {request_limiter.limit}"
+    print(f"✅ Fast responses raised the limit to {request_limiter.limit}")
+
+
+async def _test_sportsdb_client():
+    """Run all SportsDB client tests"""
+    print("🏟️ Goobie-Bot SportsDB Client Testing Suite")
+    print("=" * 50)
+
+    await _test_contended_concurrency()
+    await _test_concurrency_grows_on_success()
+    await _test_contended_rate_limiter()
+    await _test_quota_wait_not_latency()
+
+
+def test_sportsdb_client():
+    """Run the SportsDB client tests on a fresh event loop"""
+    asyncio.run(_test_sportsdb_client())
+
+
+if __name__ == "__main__":
+    test_sportsdb_client()
@@ -7,7 +7,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import logging
-from datetime import datetime
 
 from .database import TriviaDatabase
 from utils.permissions import require_admin_permissions
@@ -32,7 +31,7 @@ async def trivia_command(interaction: discord.Interaction):
                 title="🧠 Trivia Leaderboard",
                 description="No trivia scores yet! Be the first to play daily trivia!",
                 color=0x00923F,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
             embed.add_field(
                 name="How to Play",
@@ -47,7 +46,7 @@ async def trivia_command(interaction: discord.Interaction):
             title="🏆 Trivia Leaderboard",
             description="Top 10 trivia players",
             color=0xFFD700,
-            timestamp=datetime.now(),
+            timestamp=discord.utils.utcnow(),
         )
 
         # Add leaderboard entries
@@ -221,7 +220,7 @@ async def trivia_admin_command(ctx, action: str = None):
                 title="📊 Trivia Statistics",
                 description="Current trivia system statistics",
                 color=0x00923F,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             embed.add_field(
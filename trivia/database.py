@@ -10,6 +10,14 @@ from datetime import date
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+# Try to import orjson for faster wrong-answer (de)serialization (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -247,7 +255,9 @@ class TriviaDatabase:
                     (
                         question,
                         correct_answer,
-                        json.dumps(wrong_answers),
+                        orjson.dumps(wrong_answers).decode()
+                        if ORJSON_AVAILABLE
+                        else json.dumps(wrong_answers),
                         category,
                         difficulty,
                     ),
@@ -290,8 +300,11 @@ class TriviaDatabase:
                 row = cursor.fetchone()
                 if row:
                     question_data = dict(row)
-                    question_data["wrong_answers"] = json.loads(
-                        question_data["wrong_answers"]
+                    wrong_answers = question_data["wrong_answers"]
+                    question_data["wrong_answers"] = (
+                        orjson.loads(wrong_answers)
+                        if ORJSON_AVAILABLE
+                        else json.loads(wrong_answers)
                     )
                     return question_data
                 return None
@@ -16,6 +16,9 @@ from .ui import TriviaView
 
 logger = logging.getLogger(__name__)
 
+# Daily trivia is scheduled in Pacific time
+PACIFIC_TZ = pytz.timezone("America/Los_Angeles")
+
 
 class TriviaScheduler:
     """Manages daily trivia scheduling and posting"""
@@ -86,7 +89,7 @@ class TriviaScheduler:
             # Create embed
             embed = discord.Embed(
                 title="🧠 Daily Trivia",
-                description=f"**{datetime.now(pytz.timezone('America/Los_Angeles')).strftime('%B %d, %Y')}**\n\n"
+                description=f"**{datetime.now(PACIFIC_TZ).strftime('%B %d, %Y')}**\n\n"
                 f"Are you Goobier than Goobie? Answer questions "
                 f"to find out who's the Goobiest!\n\n"
                 f"⏰ You have 30 seconds per question\n"
@@ -94,7 +97,7 @@ class TriviaScheduler:
                 f"📊 Compete on the leaderboard!\n\n"
                 f"*Click the button below to start your private trivia session!*",
                 color=0x9B59B6,  # Purple
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             # Add thumbnail
@@ -128,11 +131,10 @@ class TriviaScheduler:
         try:
             logger.info("Setting up daily trivia scheduler...")
 
-            pacific_tz = pytz.timezone("America/Los_Angeles")
 
             while True:
                 # Get current time in Pacific
-                now_pacific = datetime.now(pacific_tz)
+                now_pacific = datetime.now(PACIFIC_TZ)
 
                 # Calculate next 8 PM PT
                 next_8pm = now_pacific.replace(
@@ -65,12 +65,9 @@ class TriviaView(discord.ui.View):
             await self._start_private_trivia(interaction)
 
         except Exception as e:
-            logger.error(
+            logger.exception(
                 f"❌ Error starting trivia for user {interaction.user.id}: {e}"
             )
-            import traceback
-
-            logger.error(f"❌ Full traceback: {traceback.format_exc()}")
 
             try:
                 if not interaction.response.is_done():
@@ -109,7 +106,7 @@ class TriviaView(discord.ui.View):
                 title="🏆 Trivia Leaderboard",
                 description="Top 10 trivia players",
                 color=0xFFD700,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             # Add leaderboard entries
@@ -233,12 +230,9 @@ class TriviaView(discord.ui.View):
             )
 
         except Exception as e:
-            logger.error(
+            logger.exception(
                 f"❌ Error starting private trivia for user {interaction.user.id}: {e}"
             )
-            import traceback
-
-            logger.error(f"❌ Full traceback: {traceback.format_exc()}")
 
             try:
                 if not interaction.response.is_done():
@@ -282,7 +276,7 @@ class PrivateTriviaSession:
                 f"**Difficulty:** {self.question['difficulty'].title()}\n\n"
                 f"**Question:** {self.question['question']}",
                 color=0x00923F,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             # Create answer options
@@ -311,12 +305,9 @@ class PrivateTriviaSession:
             logger.info(f"⏰ Countdown started for user {self.user.id}")
 
         except Exception as e:
-            logger.error(
+            logger.exception(
                 f"❌ Error starting trivia session for user {self.user.id}: {e}"
             )
-            import traceback
-
-            logger.error(f"❌ Full traceback: {traceback.format_exc()}")
 
             try:
                 await self.user.send(
@@ -389,7 +380,7 @@ class TriviaAnswerView(discord.ui.View):
                         color=0xFFA500
                         if remaining_time > 10
                         else 0xFF0000,  # Orange for >10s, Red for ≤10s
-                        timestamp=datetime.now(),
+                        timestamp=discord.utils.utcnow(),
                     )
 
                     # Add answer options
@@ -476,7 +467,7 @@ class TriviaAnswerView(discord.ui.View):
             embed = discord.Embed(
                 title="🎯 Trivia Result",
                 color=0x00FF00 if is_correct else 0xFF0000,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
 
             if is_correct:
@@ -540,7 +531,7 @@ class TriviaAnswerView(discord.ui.View):
                 title="⏰ Time's Up!",
                 description="You didn't answer in time. The correct answer was:",
                 color=0xFF0000,
-                timestamp=datetime.now(),
+                timestamp=discord.utils.utcnow(),
             )
             embed.add_field(
                 name="Correct Answer",
@@ -4,9 +4,19 @@ Contains helper functions and utilities
 """
 
 from .permissions import is_admin_user, has_admin_permissions, require_admin_permissions
+from .command_sync import (
+    command_tree_hash,
+    save_synced_hash,
+    sync_commands,
+    sync_commands_if_changed,
+)
 
 __all__ = [
     "is_admin_user",
     "has_admin_permissions",
     "require_admin_permissions",
+    "command_tree_hash",
+    "save_synced_hash",
+    "sync_commands",
+    "sync_commands_if_changed",
 ]
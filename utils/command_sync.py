@@ -0,0 +1,91 @@
+"""
+Command sync utilities for goobie-bot
+Skips slash command syncs with Discord when the command tree hasn't changed
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Hash of the last command tree synced with Discord, kept beside the persistent
+# cache so it lives on the api/data volume and survives container rebuilds
+COMMAND_SYNC_STATE_PATH = Path(
+    os.getenv("COMMAND_SYNC_STATE_PATH", "api/data/command_tree.sha")
+)
+
+
+def command_tree_hash(tree, guild=None) -> str:
+    """Hash the payloads of the slash commands synced to a guild (or globally)"""
+    commands = [command.to_dict() for command in tree.get_commands(guild=guild)]
+    payload = json.dumps(
+        {
+            # A state file left by another bot (e.g. a dev token) must not
+            # skip this bot's first sync
+            "application": tree.client.application_id,
+            # Switching between guild and global sync must trigger a new sync
+            "guild": guild.id if guild else None,
+            "commands": commands,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def load_synced_hash() -> Optional[str]:
+    """Load the hash of the last synced command tree, if any"""
+    try:
+        return COMMAND_SYNC_STATE_PATH.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def save_synced_hash(tree_hash: str) -> None:
+    """Record the hash of a command tree that was just synced"""
+    try:
+        COMMAND_SYNC_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        COMMAND_SYNC_STATE_PATH.write_text(tree_hash)
+    except OSError as e:
+        logger.warning(f"Could not save command sync state: {e}")
+
+
+async def _sync_tree(bot, guild=None) -> List:
+    """Sync an already prepared command tree and record its hash"""
+    synced = await bot.tree.sync(guild=guild)
+    save_synced_hash(command_tree_hash(bot.tree, guild))
+    return synced
+
+
+async def sync_commands(bot, guild=None) -> List:
+    """
+    Sync slash commands with Discord and record the synced tree
+
+    A guild sync (e.g. a dev server) propagates instantly, while a global
+    sync can take up to an hour to reach every server.
+    """
+    if guild:
+        bot.tree.copy_global_to(guild=guild)
+
+    return await _sync_tree(bot, guild)
+
+
+async def sync_commands_if_changed(bot, guild=None) -> Optional[List]:
+    """
+    Sync slash commands only if they changed since the last sync
+
+    Returns:
+        The synced commands, or None if the sync was skipped
+    """
+    if guild:
+        bot.tree.copy_global_to(guild=guild)
+
+    if command_tree_hash(bot.tree, guild) == load_synced_hash():
+        logger.info("✅ Slash commands unchanged since last sync, skipping sync")
+        return None
+
+    return await _sync_tree(bot, guild)